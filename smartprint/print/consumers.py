@@ -1,17 +1,44 @@
 import json
 import asyncio
+import hashlib
+import time
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 import logging
 from . import views
+from smartprint.firebase import firebase_app_resolved, get_firebase_app
 
 logger = logging.getLogger(__name__)
 
+
+def encode(payload):
+    """Serialize an outgoing message to a text frame (orjson when available)"""
+    return views.json_dumps(payload).decode('utf-8')
+
+
+VENDOR_GROUP_PREFIX = 'vendor_'
+VENDOR_DASHBOARD_GROUP_PREFIX = 'vendor_dashboard_'
+
+# Static replies, serialized once
+AUTH_OK = encode({'type': 'auth_status', 'status': 'success'})
+AUTH_ERR = encode({'type': 'auth_status', 'status': 'error', 'message': 'Invalid token'})
+INVALID_JSON = encode({'type': 'error', 'message': 'Invalid JSON format'})
+
+# Fixed-shape print_request frame; only the two values are JSON-encoded per send
+PRINT_REQUEST_TEMPLATE = '{"type":"print_request","file_url":%s,"request_id":%s}'
+
+# sha256(token) -> expiry, so repeat auths within a token's lifetime skip verification
+TOKEN_CACHE_TTL = 3300
+TOKEN_CACHE_MAXSIZE = 10000
+_verified_tokens = {}
+
 class VendorConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         """Handle WebSocket connection for vendor client"""
         self.vendor_id = self.scope['url_route']['kwargs']['vendor_id']
-        self.room_group_name = f'vendor_{self.vendor_id}'
+        self.room_group_name = VENDOR_GROUP_PREFIX + self.vendor_id
+        # Assume the vendor can print until its client says otherwise
+        self.printer_available = True
         
         # Join room group
         await self.channel_layer.group_add(
@@ -23,7 +50,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
         logger.info(f"Enhanced Vendor {self.vendor_id} connected")
         
         # Send initial status
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=encode({
             'type': 'connection_status',
             'status': 'connected',
             'vendor_id': self.vendor_id,
@@ -42,63 +69,31 @@ class VendorConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle incoming WebSocket messages from vendor client"""
         try:
-            data = json.loads(text_data)
-            message_type = data.get('type')
-            
-            if message_type == 'auth':
-                # Handle authentication (from vendor/consumers.py)
-                token = data.get('token')
-                if await self.verify_token(token):
-                    await self.send(json.dumps({
-                        'type': 'auth_status',
-                        'status': 'success'
-                    }))
-                else:
-                    await self.send(json.dumps({
-                        'type': 'auth_status',
-                        'status': 'error',
-                        'message': 'Invalid token'
-                    }))
-                return
-            
-            if message_type == 'print_status':
-                # Handle print status updates (from vendor/consumers.py)
-                await self.handle_print_status(data)
-                return
-            
-            if message_type == 'request_print_jobs':
-                # Enhanced request handling with R2 folder structure validation
-                await self.handle_print_jobs_request(data)
-                
-            elif message_type == 'job_completed':
-                # Handle job completion notification
-                await self.handle_job_completed(data)
-                
-            elif message_type == 'job_failed':
-                # Handle job failure notification
-                await self.handle_job_failed(data)
-                
-            elif message_type == 'status_update':
-                # Handle vendor client status updates
-                await self.handle_status_update(data)
-                
-            elif message_type == 'printer_status':
-                # Handle printer status updates
-                await self.handle_printer_status(data)
-                
+            data = views.json_loads(text_data)
+            handler = self.HANDLERS.get(data.get('type'), VendorConsumer.handle_unknown)
+            await handler(self, data)
+
         except json.JSONDecodeError:
             logger.error("Invalid JSON received from vendor client")
-            await self.send(text_data=json.dumps({
-                'type': 'error',
-                'message': 'Invalid JSON format'
-            }))
+            await self.send(text_data=INVALID_JSON)
         except Exception as e:
             logger.error(f"Error processing vendor message: {e}")
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode({
                 'type': 'error',
                 'message': f'Error processing message: {str(e)}'
             }))
 
+    async def handle_auth(self, data):
+        """Handle authentication (from vendor/consumers.py)"""
+        if await self.verify_token(data.get('token')):
+            await self.send(AUTH_OK)
+        else:
+            await self.send(AUTH_ERR)
+
+    async def handle_unknown(self, data):
+        """Ignore message types this consumer does not handle"""
+        logger.debug(f"Ignoring unknown message type from vendor {self.vendor_id}: {data.get('type')}")
+
     async def handle_print_jobs_request(self, data):
         """Handle print job requests with enhanced R2 folder structure validation"""
         try:
@@ -107,12 +102,22 @@ class VendorConsumer(AsyncWebsocketConsumer):
             queue_status = data.get('queue_status', {})
             
             logger.info(f"Enhanced print jobs requested by vendor {vendor_id}")
+
+            # Don't hand out jobs the vendor would download only to fail
+            if not self.printer_available:
+                await self.send(text_data=encode({
+                    'type': 'print_jobs_response',
+                    'message': 'Vendor has no printer available',
+                    'jobs': [],
+                    'vendor_id': vendor_id
+                }))
+                return
             
             # Get pending jobs with R2 folder structure validation
             pending_jobs = await self.get_enhanced_pending_jobs(vendor_id, r2_folder_structure)
             
             if not pending_jobs:
-                await self.send(text_data=json.dumps({
+                await self.send(text_data=encode({
                     'type': 'print_jobs_response',
                     'message': 'No pending print jobs with valid R2 structure',
                     'jobs': [],
@@ -131,7 +136,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
             if validated_jobs:
                 # Send jobs one by one with small delays to prevent overwhelming
                 for job in validated_jobs:
-                    await self.send(text_data=json.dumps({
+                    await self.send(text_data=encode({
                         'type': 'print_job',
                         'job': {
                             'filename': job['filename'],
@@ -149,7 +154,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
                 
                 logger.info(f"Sent {len(validated_jobs)} validated print jobs to vendor {vendor_id}")
             else:
-                await self.send(text_data=json.dumps({
+                await self.send(text_data=encode({
                     'type': 'print_jobs_response',
                     'message': 'No jobs passed R2 structure validation',
                     'jobs': [],
@@ -158,7 +163,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
                 
         except Exception as e:
             logger.error(f"Error handling enhanced print jobs request: {e}")
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode({
                 'type': 'error',
                 'message': f'Error getting print jobs: {str(e)}'
             }))
@@ -180,7 +185,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
             )
             
             # Send confirmation
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode({
                 'type': 'job_status_updated',
                 'filename': filename,
                 'status': 'completed',
@@ -198,7 +203,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
             
         except Exception as e:
             logger.error(f"Error handling enhanced job completion: {e}")
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode({
                 'type': 'error',
                 'message': f'Error updating job completion: {str(e)}'
             }))
@@ -218,7 +223,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
             await self.track_enhanced_job_failure(filename, vendor_id, error_message, user_email)
             
             # Send acknowledgment
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode({
                 'type': 'job_status_updated',
                 'filename': filename,
                 'status': 'failed',
@@ -230,6 +235,16 @@ class VendorConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             logger.error(f"Error handling enhanced job failure: {e}")
 
+    async def handle_job_status_batch(self, data):
+        """Handle a batch of job_completed/job_failed updates sent as one frame"""
+        vendor_id = data.get('vendor_id')
+        for update in data.get('updates', []):
+            handler = self.BATCHABLE_HANDLERS.get(update.get('type'))
+            if handler is None:
+                logger.debug(f"Ignoring unknown batched update from vendor {self.vendor_id}: {update.get('type')}")
+                continue
+            await handler(self, {'vendor_id': vendor_id, **update})
+
     async def handle_status_update(self, data):
         """Handle vendor client status updates"""
         try:
@@ -245,6 +260,12 @@ class VendorConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             logger.error(f"Error handling enhanced status update: {e}")
 
+    async def handle_vendor_capabilities(self, data):
+        """Record whether the vendor client currently has a usable printer"""
+        self.printer_available = bool(data.get('printer_available', True))
+        logger.info(f"Vendor {self.vendor_id} printer available: {self.printer_available} "
+                    f"({data.get('printer_name')})")
+
     async def handle_printer_status(self, data):
         """Handle printer status updates from vendor client"""
         try:
@@ -373,7 +394,7 @@ class VendorConsumer(AsyncWebsocketConsumer):
         """Notify vendor dashboard of events"""
         try:
             # Send notification to vendor dashboard group
-            dashboard_group = f'vendor_dashboard_{vendor_id}'
+            dashboard_group = VENDOR_DASHBOARD_GROUP_PREFIX + str(vendor_id)
             await self.channel_layer.group_send(
                 dashboard_group,
                 {
@@ -388,49 +409,111 @@ class VendorConsumer(AsyncWebsocketConsumer):
     # WebSocket event handlers for group messages
     async def dashboard_notification(self, event):
         """Handle dashboard notification events"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=encode({
             'type': 'dashboard_notification',
             'data': event['data']
         }))
 
     async def print_job_request(self, event):
         """Handle print job request events"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=encode({
             'type': 'print_job_request',
             'job': event['job']
         }))
 
     async def priority_job_request(self, event):
         """Handle priority print job request events"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=encode({
             'type': 'priority_job',
             'job': event['job']
         }))
 
-    @database_sync_to_async
-    def verify_token(self, token):
+    async def verify_token(self, token):
         """Verify vendor token (from vendor/consumers.py)"""
-        # Add your token verification logic here
-        return True  # For testing, always return True
+        if not token or not isinstance(token, str):
+            return False
 
-    @database_sync_to_async
-    def handle_print_status(self, data):
+        token_key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        expires_at = _verified_tokens.get(token_key)
+        if expires_at and expires_at > time.time():
+            return True
+
+        # Only the first call can block on SDK initialization; later ones return at once
+        if firebase_app_resolved():
+            firebase_app = get_firebase_app()
+        else:
+            firebase_app = await asyncio.to_thread(get_firebase_app)
+        if firebase_app is None:
+            logger.warning("Firebase is not configured; accepting vendor token without verification")
+            return True
+
+        # Cheap structural check before the network round-trip: a Firebase ID token is a three-part JWT
+        if token.count('.') != 2:
+            return False
+
+        try:
+            from firebase_admin import auth
+            claims = await asyncio.to_thread(auth.verify_id_token, token, firebase_app)
+        except Exception as e:
+            logger.warning(f"Token verification failed for vendor {self.vendor_id}: {e}")
+            return False
+
+        now = time.time()
+        if len(_verified_tokens) >= TOKEN_CACHE_MAXSIZE:
+            # Drop expired tokens first; evict the oldest only if the cache is still full
+            for expired_key in [k for k, exp in _verified_tokens.items() if exp <= now]:
+                del _verified_tokens[expired_key]
+            if len(_verified_tokens) >= TOKEN_CACHE_MAXSIZE:
+                _verified_tokens.pop(next(iter(_verified_tokens)))
+        _verified_tokens[token_key] = min(claims.get('exp', 0), now + TOKEN_CACHE_TTL)
+        return True
+
+    async def handle_print_status(self, data):
         """Handle print status updates (from vendor/consumers.py)"""
+        request_id = data.get('request_id')
+        status = data.get('status')
+        # Reject malformed updates on the event loop instead of after a thread hop
+        if not isinstance(request_id, (int, str)) or isinstance(request_id, bool) or not isinstance(status, str):
+            logger.error(f"Malformed print_status message from vendor {self.vendor_id}: {data}")
+            return
+        await self.update_print_job_status(request_id, status)
+
+    @database_sync_to_async
+    def update_print_job_status(self, request_id, status):
+        """Persist a print job status update"""
         try:
             from .models import PrintJob
-            print_job = PrintJob.objects.get(id=data.get('request_id'))
-            print_job.status = data.get('status')
-            print_job.save()
-        except PrintJob.DoesNotExist:
-            logger.error(f"Print job {data.get('request_id')} not found")
+        except ImportError:
+            logger.error("PrintJob model is not available; ignoring print status update")
+            return
+        try:
+            # Single UPDATE ... WHERE id = ?, no model instance round-trip
+            updated = PrintJob.objects.filter(id=request_id).update(status=status)
+            if not updated:
+                logger.error(f"Print job {request_id} not found")
         except Exception as e:
             logger.error(f"Error updating print job status: {e}")
 
     async def send_print_request(self, event):
         """Send print request to vendor (from vendor/consumers.py)"""
         print_job = event['print_job']
-        await self.send(json.dumps({
-            'type': 'print_request',
-            'file_url': print_job['file_url'],
-            'request_id': print_job['id']
-        }))
+        await self.send(PRINT_REQUEST_TEMPLATE % (encode(print_job['file_url']), encode(print_job['id'])))
+
+    # Message type -> handler, looked up once per frame in receive()
+    HANDLERS = {
+        'auth': handle_auth,
+        'print_status': handle_print_status,
+        'request_print_jobs': handle_print_jobs_request,
+        'job_completed': handle_job_completed,
+        'job_failed': handle_job_failed,
+        'job_status_batch': handle_job_status_batch,
+        'status_update': handle_status_update,
+        'printer_status': handle_printer_status,
+        'vendor_capabilities': handle_vendor_capabilities,
+    }
+
+    # Update types accepted inside a job_status_batch frame
+    BATCHABLE_HANDLERS = {
+        'job_completed': handle_job_completed,
+        'job_failed': handle_job_failed,
+    }
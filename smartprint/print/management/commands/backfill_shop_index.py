@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from smartprint.r2 import get_r2_client
+
+from print.views import SHOP_INDEX_KEY, build_shop_index, invalidate_shop_folder_cache, json_dumps
+
+
+class Command(BaseCommand):
+    help = "Rebuild vendor_register_details/_index.json from every vendor's registration_details.json"
+
+    def handle(self, *args, **options):
+        s3 = get_r2_client()
+
+        shop_index = build_shop_index(s3)
+        s3.put_object(Bucket=settings.R2_BUCKET, Key=SHOP_INDEX_KEY, Body=json_dumps(shop_index),
+                      ContentType='application/json')
+        invalidate_shop_folder_cache()
+        self.stdout.write(self.style.SUCCESS(f"✅ Wrote {len(shop_index)} shops to {SHOP_INDEX_KEY}"))
@@ -18,6 +18,7 @@ urlpatterns = [
     path('auto-print-documents/', views.auto_print_documents, name='auto-print-documents'),
     path('get-vendor-print-jobs/', views.get_vendor_print_jobs, name='get_vendor_print_jobs'),
     path('update-job-status/', update_job_status, name='update_job_status'),
+    path('update-job-status-batch/', views.update_job_status_batch, name='update_job_status_batch'),
     path('login/', sign_in, name='login'),
     path('auth-receiver/', auth_receiver, name='auth_receiver'),
     path('photoprint/', photoprint, name='photoprint'),
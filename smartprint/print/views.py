@@ -2,9 +2,11 @@ from django.shortcuts import render, redirect
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth import login
 from django.contrib.auth.models import User
-import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import json
 import requests
@@ -14,6 +16,56 @@ import re
 from django.contrib.auth.hashers import make_password, check_password
 from django.utils import timezone
 import os
+from smartprint.r2 import get_r2_client
+import threading
+import time
+import functools
+import hmac
+import secrets
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize to UTF-8 JSON bytes, ready to use as an R2 object Body"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Parallel R2 reads share the client's connection pool (see smartprint.r2)
+R2_FETCH_WORKERS = 32
+
+# Patterns used by the sanitizers and registration validation
+_EMAIL_BAD = re.compile(r'[^a-zA-Z0-9_]')
+_SHOP_BAD = re.compile(r'[^a-zA-Z0-9_\s]')
+_WS = re.compile(r'\s+')
+_EMAIL_VALID = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
+# Background writer for R2 artifacts a response does not need to wait on
+_BG = ThreadPoolExecutor(max_workers=8, thread_name_prefix='r2-background')
+
+# shop_folder -> (vendor_email, vendor_id), only changes when a vendor registers
+SHOP_FOLDER_CACHE_TTL = 300
+_shop_folder_cache = {}
+_shop_folder_lock = threading.Lock()
+
+# Parsed registration_details.json per vendor, keyed by reg:<sanitized email>
+REGISTRATION_CACHE_TTL = 300
+
+# Single manifest of every registered shop, maintained on registration (see R2_SHOP_INDEX_ENABLED)
+SHOP_INDEX_KEY = 'vendor_register_details/_index.json'
+SHOP_INDEX_MAX_RETRIES = 5
 
 # ─────────────────────────────────────────────────────────────
 # BASIC PAGE VIEWS
@@ -69,11 +121,7 @@ def get_user_details_from_r2(user_email):
     """
     Fetch user details from R2 storage signup folder
     """
-    s3 = boto3.client('s3',
-                      aws_access_key_id=settings.R2_ACCESS_KEY,
-                      aws_secret_access_key=settings.R2_SECRET_KEY,
-                      endpoint_url=settings.R2_ENDPOINT,
-                      region_name='auto')
+    s3 = get_r2_client()
 
     try:
         # List all files in signupdetails folder
@@ -85,8 +133,7 @@ def get_user_details_from_r2(user_email):
                 try:
                     # Get the JSON file content
                     response = s3.get_object(Bucket=settings.R2_BUCKET, Key=key)
-                    content = response['Body'].read().decode('utf-8')
-                    user_data = json.loads(content)
+                    user_data = json_loads(response['Body'].read())
 
                     # Check if this is the user we're looking for
                     if user_data.get('email') == user_email:
@@ -114,11 +161,7 @@ def get_user_jobs_from_r2(user_email):
     """
     Get all jobs uploaded by a specific user from R2 storage
     """
-    s3 = boto3.client('s3',
-                      aws_access_key_id=settings.R2_ACCESS_KEY,
-                      aws_secret_access_key=settings.R2_SECRET_KEY,
-                      endpoint_url=settings.R2_ENDPOINT,
-                      region_name='auto')
+    s3 = get_r2_client()
 
     try:
         # List all files in the user's folder
@@ -304,13 +347,7 @@ def get_vendor_print_jobs(request):
             # Convert vendor_id to string to ensure consistency
             vendor_id = str(vendor_id).strip()
 
-            s3 = boto3.client(
-                's3',
-                aws_access_key_id=settings.R2_ACCESS_KEY,
-                aws_secret_access_key=settings.R2_SECRET_KEY,
-                endpoint_url=settings.R2_ENDPOINT,
-                region_name='auto'
-            )
+            s3 = get_r2_client()
 
             # HARDCODED PATH: Only fetch from vendor_print_jobs/<vendor_id>/
             prefix = f'vendor_print_jobs/{vendor_id}/'
@@ -484,11 +521,7 @@ def get_vendor_print_jobs(request):
 def get_vendor_specific_print_jobs(vendor_id):
     """Get pending print jobs from vendor-specific folder in R2 storage"""
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
+        s3 = get_r2_client()
 
         pending_jobs = []
         vendor_folder_path = f'vendor_print_jobs/{vendor_id}'
@@ -610,14 +643,48 @@ def update_job_status(request):
     return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
 
 
+@csrf_exempt
+def update_job_status_batch(request):
+    """
+    Update completion status for several jobs reported by a vendor client in one call
+    """
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            vendor_id = data.get('vendor_id')
+            updates = data.get('updates') or []
+
+            results = {}
+            for update in updates:
+                filename = update.get('filename')
+                if not filename:
+                    continue
+                status = update.get('status', 'completed')
+                job_completed_status = 'YES' if status.lower() in ['completed', 'yes'] else 'NO'
+                results[filename] = update_file_job_status(
+                    filename, job_completed_status, vendor_id, update.get('completion_time'))
+
+            updated = sum(results.values())
+            print(f"✅ Job status batch from vendor {vendor_id}: {updated}/{len(results)} updated")
+            return JsonResponse({
+                'success': updated == len(results),
+                'updated': updated,
+                'failed': [name for name, ok in results.items() if not ok]
+            })
+
+        except json.JSONDecodeError:
+            return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
+        except Exception as e:
+            print(f"Error updating job status batch: {str(e)}")
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+    return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
+
+
 def get_pending_print_jobs():
     """Get pending print jobs from R2 storage with enhanced validation (for admin or dashboard only)"""
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
+        s3 = get_r2_client()
 
         pending_jobs = []
 
@@ -705,11 +772,7 @@ def get_pending_print_jobs():
 def update_job_status_in_r2(filename, status, vendor_id, user_email, r2_folder_structure):
     """Update job status in R2 storage with enhanced folder structure validation"""
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
+        s3 = get_r2_client()
         job_completed_status = 'YES' if status.upper() == 'YES' else 'NO'
         updated_files = []
         # Only update vendor-specific folders (no testshop)
@@ -788,11 +851,7 @@ def update_file_job_status(filename, status='YES', vendor_id=None, completion_ti
     """
     Update the job_completed metadata for a specific file
     """
-    s3 = boto3.client('s3',
-                      aws_access_key_id=settings.R2_ACCESS_KEY,
-                      aws_secret_access_key=settings.R2_SECRET_KEY,
-                      endpoint_url=settings.R2_ENDPOINT,
-                      region_name='auto')
+    s3 = get_r2_client()
 
     try:
         # Get current object metadata
@@ -854,11 +913,7 @@ def upload_to_r2(request):
             vendor_id = request.POST.get('vendor_id') or get_vendor_id_by_shop_folder(selected_vendor)
 
             # Initialize S3 client
-            s3 = boto3.client('s3',
-                              aws_access_key_id=settings.R2_ACCESS_KEY,
-                              aws_secret_access_key=settings.R2_SECRET_KEY,
-                              endpoint_url=settings.R2_ENDPOINT,
-                              region_name='auto')
+            s3 = get_r2_client()
 
             # Get user email for folder creation
             user_email = request.user.email if request.user.is_authenticated else 'anonymous'
@@ -960,11 +1015,7 @@ def upload_to_r2(request):
 
 
 def list_r2_files():
-    s3 = boto3.client('s3',
-                      aws_access_key_id=settings.R2_ACCESS_KEY,
-                      aws_secret_access_key=settings.R2_SECRET_KEY,
-                      endpoint_url=settings.R2_ENDPOINT,
-                      region_name='auto')
+    s3 = get_r2_client()
 
     try:
         file_data = []
@@ -1160,11 +1211,7 @@ def process_print_request(request):
                     file_name = file.name
 
                     # Initialize S3 client
-                    s3 = boto3.client('s3',
-                                      aws_access_key_id=settings.R2_ACCESS_KEY,
-                                      aws_secret_access_key=settings.R2_SECRET_KEY,
-                                      endpoint_url=settings.R2_ENDPOINT,
-                                      region_name='auto')
+                    s3 = get_r2_client()
 
                     # Upload the original file with metadata
                     s3.put_object(Bucket=settings.R2_BUCKET,
@@ -1223,11 +1270,7 @@ def auth_receiver(request):
 
             # Store the raw authentication details in R2 storage
             try:
-                s3 = boto3.client('s3',
-                                  aws_access_key_id=settings.R2_ACCESS_KEY,
-                                  aws_secret_access_key=settings.R2_SECRET_KEY,
-                                  endpoint_url=settings.R2_ENDPOINT,
-                                  region_name='auto')
+                s3 = get_r2_client()
 
                 file_content = json.dumps(data, indent=4)
                 file_key = f"signupdetails/{google_user_id}.json"
@@ -1288,11 +1331,7 @@ def vendor_pricing(request):
                 return JsonResponse({'success': False, 'message': 'Vendor email required'})
 
             # Initialize S3 client
-            s3 = boto3.client('s3',
-                              aws_access_key_id=settings.R2_ACCESS_KEY,
-                              aws_secret_access_key=settings.R2_SECRET_KEY,
-                              endpoint_url=settings.R2_ENDPOINT,
-                              region_name='auto')
+            s3 = get_r2_client()
 
             # Prepare pricing data
             pricing_data = {
@@ -1336,18 +1375,11 @@ def vendor_info(request, vendor_id):
     """
     try:
         # Initialize S3 client
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
+        s3 = get_r2_client()
 
         # Look for vendor registration file
-        file_key = f"vendor_register_details/{sanitize_email(vendor_id)}/registration_details.json"
-
         try:
-            response = s3.get_object(Bucket=settings.R2_BUCKET, Key=file_key)
-            vendor_data = json.loads(response['Body'].read().decode('utf-8'))
+            vendor_data = get_registration_details(s3, vendor_id)
 
             return JsonResponse({
                 'success': True,
@@ -1381,7 +1413,7 @@ def vendor_login(request):
     """
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
+            data = json_loads(request.body)
             email = data.get('email')  # frontend now sends email as 'email'
             password = data.get('password')
 
@@ -1392,23 +1424,20 @@ def vendor_login(request):
                 })
 
             # Initialize R2 client
-            s3 = boto3.client('s3',
-                              aws_access_key_id=settings.R2_ACCESS_KEY,
-                              aws_secret_access_key=settings.R2_SECRET_KEY,
-                              endpoint_url=settings.R2_ENDPOINT,
-                              region_name='auto')
+            s3 = get_r2_client()
 
             # Search for vendor by email in the new R2 structure
             found_vendor = None
             vendor_id = None
 
             try:
-                objects = s3.list_objects_v2(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/')
-                for obj in objects.get("Contents", []):
-                    if obj["Key"].endswith('/login_details.json'):
+                paginator = s3.get_paginator('list_objects_v2')
+                objects = paginator.paginate(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/').search('Contents')
+                for obj in objects:
+                    if obj and obj["Key"].endswith('/login_details.json'):
                         try:
                             response = s3.get_object(Bucket=settings.R2_BUCKET, Key=obj["Key"])
-                            login_details = json.loads(response['Body'].read().decode('utf-8'))
+                            login_details = json_loads(response['Body'].read())
                             if login_details.get('email') == email:
                                 found_vendor = login_details
                                 # Extract vendor_id from the key path
@@ -1429,12 +1458,11 @@ def vendor_login(request):
                     # Update last login timestamp
                     found_vendor['last_login'] = timezone.now().isoformat()
                     login_key = f'vendor_register_details/{sanitize_email(email)}/login_details.json'
-                    s3.put_object(Bucket=settings.R2_BUCKET, Key=login_key, Body=json.dumps(found_vendor), ContentType='application/json')
+                    s3.put_object(Bucket=settings.R2_BUCKET, Key=login_key, Body=json_dumps(found_vendor), ContentType='application/json')
 
                     # Get vendor registration details for additional info
                     try:
-                        reg_response = s3.get_object(Bucket=settings.R2_BUCKET, Key=f'vendor_register_details/{sanitize_email(email)}/registration_details.json')
-                        reg_details = json.loads(reg_response['Body'].read().decode('utf-8'))
+                        reg_details = get_registration_details(s3, email)
                         vendor_name = reg_details.get('vendor_name', '')
                     except:
                         vendor_name = ''
@@ -1483,7 +1511,7 @@ def vendor_register_api(request):
     """
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
+            data = json_loads(request.body)
             email = data.get('email')
             password = data.get('password')
             vendor_name = data.get('vendor_name')
@@ -1500,8 +1528,7 @@ def vendor_register_api(request):
                 })
 
             # Validate email format
-            email_regex = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-            if not re.match(email_regex, email):
+            if not _EMAIL_VALID.match(email):
                 return JsonResponse({
                     'success': False,
                     'message': 'Please enter a valid email address'
@@ -1514,46 +1541,45 @@ def vendor_register_api(request):
                     'message': 'Password must be at least 8 characters long'
                 })
 
-            if not re.search(r'[a-zA-Z]', password) or not re.search(r'\d', password):
+            has_alpha = any(c.isascii() and c.isalpha() for c in password)
+            has_digit = any(c.isdecimal() for c in password)
+            if not (has_alpha and has_digit):
                 return JsonResponse({
                     'success': False,
                     'message': 'Password must contain at least one letter and one number'
                 })
 
             # Validate phone number (10 digits)
-            phone_clean = re.sub(r'\D', '', phone_number)
+            phone_clean = ''.join(c for c in phone_number if c.isdecimal())
             if len(phone_clean) != 10:
                 return JsonResponse({
                     'success': False,
                     'message': 'Please enter a valid 10-digit phone number'
                 })
 
-            # Generate unique 10-digit vendor ID and token
-            vendor_id = str(random.randint(1000000000, 9999999999))
-            vendor_token = str(random.randint(1000000000, 9999999999))
-
-            # Hash password
-            password_hash = make_password(password)
-
-            # Initialize S3 client
-            s3 = boto3.client('s3',
-                              aws_access_key_id=settings.R2_ACCESS_KEY,
-                              aws_secret_access_key=settings.R2_SECRET_KEY,
-                              endpoint_url=settings.R2_ENDPOINT,
-                              region_name='auto')
+            san = sanitize_email(email)
+            s3 = get_r2_client()
 
             # Check if email already exists
             try:
-                objects = s3.list_objects_v2(Bucket=settings.R2_BUCKET, Prefix=f'vendor_register_details/{sanitize_email(email)}/')
-                for obj in objects.get("Contents", []):
-                    if obj["Key"].endswith('registration_details.json'):
-                        return JsonResponse({
-                            'success': False,
-                            'message': 'Email already registered'
-                        })
-            except Exception as e:
+                s3.head_object(Bucket=settings.R2_BUCKET, Key=f'vendor_register_details/{san}/registration_details.json')
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Email already registered'
+                })
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+                    print(f"Warning: Could not check for existing email: {str(e)}")
+            except BotoCoreError as e:
                 print(f"Warning: Could not check for existing email: {str(e)}")
 
+            # Generate high-entropy vendor ID and token; random enough to store as-is
+            vendor_id = secrets.token_hex(8)
+            vendor_token = secrets.token_hex(16)
+
+            # Hash password only once we know the registration will go ahead
+            password_hash = make_password(password)
+
             # Prepare registration details
             registration_details = {
                 'vendor_email': email,
@@ -1567,8 +1593,7 @@ def vendor_register_api(request):
                 'registration_date': timezone.now().isoformat(),
                 'hashed_password': password_hash
             }
-            reg_key = f'vendor_register_details/{sanitize_email(email)}/registration_details.json'
-            s3.put_object(Bucket=settings.R2_BUCKET, Key=reg_key, Body=json.dumps(registration_details), ContentType='application/json')
+            vendor_folder = f'vendor_register_details/{san}/'
 
             # Prepare login details
             login_details = {
@@ -1576,34 +1601,49 @@ def vendor_register_api(request):
                 'hashed_password': password_hash,
                 'last_login': None
             }
-            login_key = f'vendor_register_details/{sanitize_email(email)}/login_details.json'
-            s3.put_object(Bucket=settings.R2_BUCKET, Key=login_key, Body=json.dumps(login_details), ContentType='application/json')
 
             # Create shop folder with vendor name
             shop_folder_name = sanitize_shop_name(vendor_name)
-            shop_folder_key = f'vendor_register_details/{sanitize_email(email)}/{shop_folder_name}/'
-
-            # Create shop info file with hashed vendor ID and token
-            s3.put_object(
-                Bucket=settings.R2_BUCKET,
-                Key=f'{shop_folder_key}shop_info.json',
-                Body=json.dumps({
-                    'shop_name': vendor_name,
-                    'vendor_id_hash': make_password(vendor_id),
-                    'vendor_token_hash': make_password(vendor_token),
-                    'created_at': timezone.now().isoformat(),
-                    'folder_created': True
-                }),
-                ContentType='application/json'
-            )
+            shop_folder_key = f'{vendor_folder}{shop_folder_name}/'
+
+            # Create shop info file with vendor ID and token
+            shop_info = {
+                'shop_name': vendor_name,
+                'vendor_id': vendor_id,
+                'vendor_token': vendor_token,
+                'created_at': timezone.now().isoformat(),
+                'folder_created': True
+            }
 
-            # Prepare pricing details if present
+            def put_json(key, payload):
+                s3.put_object(Bucket=settings.R2_BUCKET, Key=key, Body=json_dumps(payload),
+                              ContentType='application/json')
+
+            # Registration, login and shop info records must exist before we answer; upload them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                critical = [executor.submit(put_json, f'{vendor_folder}registration_details.json', registration_details),
+                            executor.submit(put_json, f'{vendor_folder}login_details.json', login_details),
+                            executor.submit(put_json, f'{shop_folder_key}shop_info.json', shop_info)]
+                for future in critical:
+                    future.result()
+
+            # Pricing entries are written in the background
+            deferred = []
             pricing_entries = data.get('pricing_entries', [])
             for entry in pricing_entries:
                 pricing_id = str(uuid.uuid4())
-                key = f'vendor_register_details/{sanitize_email(email)}/pricing_details/pricing_{pricing_id}.json'
-                s3.put_object(Bucket=settings.R2_BUCKET, Key=key, Body=json.dumps(entry), ContentType='application/json')
+                deferred.append((f'{vendor_folder}pricing_details/pricing_{pricing_id}.json', entry))
+            for key, payload in deferred:
+                _BG.submit(put_json, key, payload).add_done_callback(functools.partial(log_background_failure, key))
+
+            if settings.R2_SHOP_INDEX_ENABLED:
+                try:
+                    update_shop_index(s3, shop_folder_name, registration_details)
+                except Exception as e:
+                    print(f"❌ Error updating shop index for {shop_folder_name}: {str(e)}")
 
+            invalidate_shop_folder_cache()
+            cache.delete(f'reg:{san}')
             print(f"✅ Successfully registered vendor {email} with shop folder: {shop_folder_name}")
 
             return JsonResponse({
@@ -1627,14 +1667,30 @@ def vendor_register_api(request):
         'message': 'Invalid request method'
     })
 
+def get_registration_details(s3, email):
+    """Read a vendor's registration_details.json through the Django cache"""
+    san = sanitize_email(email)
+    cache_key = f'reg:{san}'
+    vendor_data = cache.get(cache_key)
+    if vendor_data is None:
+        response = s3.get_object(Bucket=settings.R2_BUCKET, Key=f'vendor_register_details/{san}/registration_details.json')
+        vendor_data = json_loads(response['Body'].read())
+        cache.set(cache_key, vendor_data, REGISTRATION_CACHE_TTL)
+    return vendor_data
+
+def log_background_failure(key, future):
+    """Done-callback for background R2 uploads"""
+    if future.exception():
+        print(f"❌ Background upload of {key} failed: {future.exception()}")
+
 @csrf_exempt
 def vendor_authenticate(request):
     """
-    Authenticate vendor using vendor_id and vendor_token (hashed in shop_info.json)
+    Authenticate vendor using vendor_id and vendor_token stored in shop_info.json
     """
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
+            data = json_loads(request.body)
             vendor_email = data.get('vendor_email')
             vendor_id = data.get('vendor_id')
             vendor_token = data.get('vendor_token')
@@ -1643,20 +1699,21 @@ def vendor_authenticate(request):
             if not all([vendor_email, vendor_id, vendor_token, shop_name]):
                 return JsonResponse({'success': False, 'error': 'Missing credentials'}, status=400)
 
-            s3 = boto3.client('s3',
-                aws_access_key_id=settings.R2_ACCESS_KEY,
-                aws_secret_access_key=settings.R2_SECRET_KEY,
-                endpoint_url=settings.R2_ENDPOINT,
-                region_name='auto'
-            )
+            s3 = get_r2_client()
             shop_folder = sanitize_shop_name(shop_name)
             shop_info_key = f'vendor_register_details/{sanitize_email(vendor_email)}/{shop_folder}/shop_info.json'
             try:
                 response = s3.get_object(Bucket=settings.R2_BUCKET, Key=shop_info_key)
-                shop_info = json.loads(response['Body'].read().decode('utf-8'))
-                vendor_id_hash = shop_info.get('vendor_id_hash')
-                vendor_token_hash = shop_info.get('vendor_token_hash')
-                if check_password(vendor_id, vendor_id_hash) and check_password(vendor_token, vendor_token_hash):
+                shop_info = json_loads(response['Body'].read())
+                if 'vendor_token' in shop_info:
+                    # compare_digest only accepts ASCII str, so compare the UTF-8 bytes
+                    authenticated = (hmac.compare_digest(str(vendor_id).encode(), str(shop_info.get('vendor_id', '')).encode()) and
+                                     hmac.compare_digest(str(vendor_token).encode(), str(shop_info['vendor_token']).encode()))
+                else:
+                    # Shops registered before tokens were stored verbatim only have hashes
+                    authenticated = (check_password(vendor_id, shop_info.get('vendor_id_hash')) and
+                                     check_password(vendor_token, shop_info.get('vendor_token_hash')))
+                if authenticated:
                     return JsonResponse({'success': True, 'message': 'Authenticated'})
                 else:
                     return JsonResponse({'success': False, 'error': 'Invalid credentials'}, status=401)
@@ -1666,57 +1723,82 @@ def vendor_authenticate(request):
             return JsonResponse({'success': False, 'error': str(e)}, status=500)
     return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_email(email):
     # Lowercase, replace @ with _at_, . with _dot_, and remove other special chars
-    return re.sub(r'[^a-zA-Z0-9_]', '', email.lower().replace('@', '_at_').replace('.', '_dot_'))
+    return _EMAIL_BAD.sub('', email.lower().replace('@', '_at_').replace('.', '_dot_'))
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_shop_name(shop_name):
     # Convert to lowercase, replace spaces with underscores, remove special chars except underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_\s]', '', shop_name.lower())
-    sanitized = re.sub(r'\s+', '_', sanitized.strip())
+    sanitized = _SHOP_BAD.sub('', shop_name.lower())
+    sanitized = _WS.sub('_', sanitized.strip())
     return sanitized
 
+def list_registration_keys(s3):
+    """Yield registration_details.json keys from the vendor folders only, page by page"""
+    paginator = s3.get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/', Delimiter='/',
+                               PaginationConfig={'PageSize': 1000})
+    for page in pages:
+        for prefix in page.get('CommonPrefixes', []):
+            yield f"{prefix['Prefix']}registration_details.json"
+
+def fetch_registration_details(s3, keys):
+    """Fetch registration_details.json objects concurrently, preserving key order.
+
+    keys may be a generator; GETs for earlier list pages start while later pages are listed.
+    """
+    def fetch(key):
+        try:
+            response = s3.get_object(Bucket=settings.R2_BUCKET, Key=key)
+            return json_loads(response['Body'].read())
+        except s3.exceptions.NoSuchKey:
+            # Vendor folder without a completed registration
+            return None
+        except Exception as e:
+            print(f"Error reading vendor data from {key}: {str(e)}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=R2_FETCH_WORKERS) as executor:
+        return list(executor.map(fetch, keys))
+
 @csrf_exempt
 def get_available_shops(request):
     """
     Get all available shops from R2 storage vendor registration details
     """
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
+        s3 = get_r2_client()
         shops = []
+        seen_folders = set()
         try:
-            objects = s3.list_objects_v2(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/')
-            for obj in objects.get("Contents", []):
-                key = obj["Key"]
-                if key.endswith('/registration_details.json'):
-                    try:
-                        response = s3.get_object(Bucket=settings.R2_BUCKET, Key=key)
-                        vendor_data = json.loads(response['Body'].read().decode('utf-8'))
-                        vendor_name = vendor_data.get('vendor_name', '')
-                        vendor_email = vendor_data.get('vendor_email', '')
-                        shop_address = vendor_data.get('shop_address', '')
-                        city = vendor_data.get('city', '')
-                        if vendor_name and vendor_email:
-                            shop_folder = sanitize_shop_name(vendor_name)
-                            shop_info = {
-                                'shop_name': vendor_name,
-                                'shop_folder': shop_folder,
-                                'vendor_email': vendor_email,
-                                'shop_address': shop_address,
-                                'city': city,
-                                'status': 'Available',
-                                'vendor_id': vendor_data.get('vendor_id', ''),
-                                'vendor_token': vendor_data.get('vendor_token', '')
-                            }
-                            if not any(s['shop_folder'] == shop_folder for s in shops):
-                                shops.append(shop_info)
-                    except Exception as e:
-                        print(f"Error reading vendor data from {key}: {str(e)}")
-                        continue
+            if settings.R2_SHOP_INDEX_ENABLED:
+                vendor_records = list((load_shop_index(s3) or {}).values())
+            else:
+                vendor_records = fetch_registration_details(s3, list_registration_keys(s3))
+            for vendor_data in vendor_records:
+                if not vendor_data:
+                    continue
+                vendor_name = vendor_data.get('vendor_name', '')
+                vendor_email = vendor_data.get('vendor_email', '')
+                shop_address = vendor_data.get('shop_address', '')
+                city = vendor_data.get('city', '')
+                if vendor_name and vendor_email:
+                    shop_folder = sanitize_shop_name(vendor_name)
+                    shop_info = {
+                        'shop_name': vendor_name,
+                        'shop_folder': shop_folder,
+                        'vendor_email': vendor_email,
+                        'shop_address': shop_address,
+                        'city': city,
+                        'status': 'Available',
+                        'vendor_id': vendor_data.get('vendor_id', ''),
+                        'vendor_token': vendor_data.get('vendor_token', '')
+                    }
+                    if shop_folder not in seen_folders:
+                        seen_folders.add(shop_folder)
+                        shops.append(shop_info)
         except Exception as e:
             print(f"Error listing vendor folders: {str(e)}")
         return JsonResponse({
@@ -1735,31 +1817,87 @@ def get_available_shops(request):
 def vendor_email_folder(email):
     return f'vendor_register_details/{sanitize_email(email)}'
 
+def _load_shop_folder_map():
+    """Map every shop folder to its (vendor_email, vendor_id), cached for SHOP_FOLDER_CACHE_TTL seconds"""
+    with _shop_folder_lock:
+        cached = _shop_folder_cache.get('__all__')
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        s3 = get_r2_client()
+
+        shop_index = load_shop_index(s3) if settings.R2_SHOP_INDEX_ENABLED else None
+        if shop_index is None:
+            # Search through vendor registration details once for all shop folders
+            shop_index = build_shop_index(s3)
+        shop_map = {shop_folder: (entry.get('vendor_email', ''), entry.get('vendor_id', ''))
+                    for shop_folder, entry in shop_index.items()}
+
+        _shop_folder_cache['__all__'] = (time.monotonic() + SHOP_FOLDER_CACHE_TTL, shop_map)
+        return shop_map
+
+def shop_index_entry(vendor_data):
+    """Fields of a registration record that the shop index keeps"""
+    return {
+        'vendor_name': vendor_data.get('vendor_name', ''),
+        'vendor_email': vendor_data.get('vendor_email', ''),
+        'vendor_id': vendor_data.get('vendor_id', ''),
+        'vendor_token': vendor_data.get('vendor_token', ''),
+        'shop_address': vendor_data.get('shop_address', ''),
+        'city': vendor_data.get('city', ''),
+    }
+
+def build_shop_index(s3):
+    """Build the shop index by walking every registration_details.json in R2"""
+    shop_index = {}
+    for vendor_data in fetch_registration_details(s3, list_registration_keys(s3)):
+        if not vendor_data:
+            continue
+        shop_folder = sanitize_shop_name(vendor_data.get('vendor_name', ''))
+        shop_index.setdefault(shop_folder, shop_index_entry(vendor_data))
+    return shop_index
+
+def load_shop_index(s3, with_etag=False):
+    """Read the shop index manifest; returns None when it has not been created yet"""
+    try:
+        response = s3.get_object(Bucket=settings.R2_BUCKET, Key=SHOP_INDEX_KEY)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return (None, None) if with_etag else None
+        raise
+    shop_index = json_loads(response['Body'].read())
+    return (shop_index, response['ETag']) if with_etag else shop_index
+
+def update_shop_index(s3, shop_folder, vendor_data):
+    """Add a shop to the index with an ETag-guarded read-modify-write, retrying on conflicts"""
+    for attempt in range(SHOP_INDEX_MAX_RETRIES):
+        shop_index, etag = load_shop_index(s3, with_etag=True)
+        condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+        shop_index = shop_index or {}
+        if shop_folder in shop_index:
+            return
+        shop_index[shop_folder] = shop_index_entry(vendor_data)
+        try:
+            s3.put_object(Bucket=settings.R2_BUCKET, Key=SHOP_INDEX_KEY, Body=json_dumps(shop_index),
+                          ContentType='application/json', **condition)
+            return
+        except ClientError as e:
+            status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if status not in (409, 412):
+                raise
+            print(f"⚠️ Shop index changed concurrently, retrying ({attempt + 1}/{SHOP_INDEX_MAX_RETRIES})")
+    raise RuntimeError('Could not update shop index after concurrent modifications')
+
+def invalidate_shop_folder_cache():
+    with _shop_folder_lock:
+        _shop_folder_cache.clear()
+
 def get_vendor_email_by_shop_folder(shop_folder):
     """Get vendor email by shop folder name from R2 storage"""
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
-
-        # Search through vendor registration details to find matching shop folder
-        objects = s3.list_objects_v2(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/')
-        for obj in objects.get("Contents", []):
-            if obj["Key"].endswith('/registration_details.json'):
-                try:
-                    response = s3.get_object(Bucket=settings.R2_BUCKET, Key=obj["Key"])
-                    vendor_data = json.loads(response['Body'].read().decode('utf-8'))
-                    vendor_name = vendor_data.get('vendor_name', '')
-                    vendor_email = vendor_data.get('vendor_email', '')
-
-                    # Check if this vendor's sanitized shop name matches
-                    if sanitize_shop_name(vendor_name) == shop_folder:
-                        return vendor_email
-                except Exception as e:
-                    print(f"Error reading vendor data from {obj['Key']}: {str(e)}")
-                    continue
+        entry = _load_shop_folder_map().get(shop_folder)
+        if entry:
+            return entry[0]
 
         # Fallback for firozshop or unknown shops
         return 'firozshop@example.com'
@@ -1771,28 +1909,9 @@ def get_vendor_email_by_shop_folder(shop_folder):
 def get_vendor_id_by_shop_folder(shop_folder):
     """Get vendor_id by shop folder name from R2 storage"""
     try:
-        s3 = boto3.client('s3',
-                          aws_access_key_id=settings.R2_ACCESS_KEY,
-                          aws_secret_access_key=settings.R2_SECRET_KEY,
-                          endpoint_url=settings.R2_ENDPOINT,
-                          region_name='auto')
-
-        # Search through vendor registration details to find matching shop folder
-        objects = s3.list_objects_v2(Bucket=settings.R2_BUCKET, Prefix='vendor_register_details/')
-        for obj in objects.get("Contents", []):
-            if obj["Key"].endswith('/registration_details.json'):
-                try:
-                    response = s3.get_object(Bucket=settings.R2_BUCKET, Key=obj["Key"])
-                    vendor_data = json.loads(response['Body'].read().decode('utf-8'))
-                    vendor_name = vendor_data.get('vendor_name', '')
-                    vendor_id = vendor_data.get('vendor_id', '')
-
-                    # Check if this vendor's sanitized shop name matches
-                    if sanitize_shop_name(vendor_name) == shop_folder:
-                        return vendor_id
-                except Exception as e:
-                    print(f"Error reading vendor data from {obj['Key']}: {str(e)}")
-                    continue
+        entry = _load_shop_folder_map().get(shop_folder)
+        if entry:
+            return entry[1]
 
         # Fallback for firozshop or unknown shops
         return 'vendor1'
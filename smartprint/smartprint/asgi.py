@@ -1,29 +1,45 @@
 import os
+import asyncio
 import django
 from django.core.asgi import get_asgi_application
 
+# Use uvloop's C event loop when it is installed. Servers that build their loop
+# before importing the application should select it themselves, e.g.
+#   uvicorn smartprint.asgi:application --loop uvloop --ws websockets --http httptools --workers 4
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# WebSocket-only workers load the trimmed settings and skip the HTTP stack
+WS_ONLY = os.environ.get('SMARTPRINT_WS_ONLY') == '1'
+
 # Set Django settings module
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartprint.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartprint.settings_ws' if WS_ONLY else 'smartprint.settings')
 
 # Setup Django before importing any Django components
 django.setup()
 
 # Now import Django-dependent modules
 from channels.routing import ProtocolTypeRouter, URLRouter
-from channels.auth import AuthMiddlewareStack
 
 # Initialize Django ASGI application early to ensure the AppRegistry
 # is populated before importing code that may import ORM models.
-django_asgi_app = get_asgi_application()
+django_asgi_app = None if WS_ONLY else get_asgi_application()
 
 # Import routing after Django is set up
 from print.routing import websocket_urlpatterns
 
-application = ProtocolTypeRouter({
-    "http": django_asgi_app,
-    "websocket": AuthMiddlewareStack(
-        URLRouter(
-            websocket_urlpatterns
-        )
+# VendorConsumer never reads scope['user'] and authenticates in-band with an
+# 'auth' message, so skip the per-handshake session and user lookups of
+# AuthMiddlewareStack. Wrap individual routes with it if one ever needs it.
+protocols = {
+    "websocket": URLRouter(
+        websocket_urlpatterns
     ),
-})
+}
+if django_asgi_app is not None:
+    protocols["http"] = django_asgi_app
+
+application = ProtocolTypeRouter(protocols)
@@ -0,0 +1,40 @@
+import asyncio
+import time
+from copy import deepcopy
+
+from channels.layers import InMemoryChannelLayer
+
+
+class FastInMemoryChannelLayer(InMemoryChannelLayer):
+    """
+    InMemoryChannelLayer whose group_send copies the message once per send
+    instead of once per member, and enqueues directly instead of creating a
+    task per member.
+
+    Every member receives the same event object, so group event handlers must
+    treat events as read-only (all handlers in print.consumers do).
+    """
+
+    async def group_send(self, group, message):
+        # Check types
+        assert isinstance(message, dict), "Message is not a dict"
+        self.require_valid_group_name(group)
+        # Run clean
+        self._clean_expired()
+
+        members = self.groups.get(group)
+        if not members:
+            return
+
+        # Snapshot once so later changes by the sender don't leak into queued events
+        shared = deepcopy(message)
+        expires = time.time() + self.expiry
+        for channel in list(members):
+            queue = self.channels.setdefault(
+                channel, asyncio.Queue(maxsize=self.get_capacity(channel))
+            )
+            try:
+                queue.put_nowait((expires, shared))
+            except asyncio.QueueFull:
+                # Full channels are skipped, as in the base group_send
+                pass
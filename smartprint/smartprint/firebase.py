@@ -0,0 +1,42 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_firebase_app = None
+_firebase_lock = threading.Lock()
+# Stored in _firebase_app when initialization failed, so it is attempted only once
+_FIREBASE_UNAVAILABLE = object()
+
+
+def firebase_app_resolved():
+    """Whether get_firebase_app() has already succeeded or failed and will return immediately"""
+    return _firebase_app is not None
+
+
+def get_firebase_app():
+    """Initialize the Firebase Admin SDK on first use and return the default app (None if it failed)"""
+    global _firebase_app
+    if _firebase_app is None:
+        with _firebase_lock:
+            if _firebase_app is None:
+                _firebase_app = _initialize_firebase_app()
+    return None if _firebase_app is _FIREBASE_UNAVAILABLE else _firebase_app
+
+
+def _initialize_firebase_app():
+    """Initialize the Firebase Admin SDK, returning the app or _FIREBASE_UNAVAILABLE"""
+    try:
+        import firebase_admin
+
+        if not firebase_admin._apps:
+            # For now, we'll initialize without credentials since we don't have the service account file
+            # You'll need to get the service account key from Firebase Console
+            firebase_admin.initialize_app()
+            logger.info("Firebase Admin SDK initialized (without credentials)")
+        else:
+            logger.debug("Firebase Admin SDK already initialized")
+        return firebase_admin.get_app()
+    except Exception:
+        logger.exception("Error initializing Firebase Admin SDK; token verification is disabled")
+        return _FIREBASE_UNAVAILABLE
@@ -0,0 +1,22 @@
+import functools
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+# One session for the process; building a session reloads botocore's endpoint and model data
+_SESSION = boto3.session.Session()
+
+# Parallel R2 reads share one connection pool, so size it above print.views.R2_FETCH_WORKERS
+R2_CLIENT_CONFIG = Config(max_pool_connections=64, retries={'max_attempts': 3})
+
+
+@functools.lru_cache(maxsize=1)
+def get_r2_client():
+    """Shared R2 client; boto3 clients are thread-safe and keep their HTTPS connections alive"""
+    return _SESSION.client('s3',
+                           aws_access_key_id=settings.R2_ACCESS_KEY,
+                           aws_secret_access_key=settings.R2_SECRET_KEY,
+                           endpoint_url=settings.R2_ENDPOINT,
+                           region_name='auto',
+                           config=R2_CLIENT_CONFIG)
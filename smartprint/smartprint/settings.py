@@ -1,17 +1,19 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-import firebase_admin
-from firebase_admin import credentials
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once; the runserver autoreloader and worker
+# processes inherit them, so they can skip re-parsing .env
+if not os.environ.get('_SMARTPRINT_ENV_LOADED'):
+    load_dotenv()
+    os.environ['_SMARTPRINT_ENV_LOADED'] = '1'
+env = os.environ.copy()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-your-secret-key')
+SECRET_KEY = env.get('SECRET_KEY', 'django-insecure-your-secret-key')
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = False
@@ -27,7 +29,6 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'channels',
-    'vendor',
     'print',
 ]
 
@@ -63,10 +64,22 @@ WSGI_APPLICATION = 'smartprint.wsgi.application'
 ASGI_APPLICATION = 'smartprint.asgi.application'
 
 # Database
+# WAL lets status updates from the consumer thread pool write while others read;
+# IMMEDIATE takes the write lock up front instead of failing on lock upgrade.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'OPTIONS': {
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA cache_size=-20000;'
+                'PRAGMA busy_timeout=5000;'
+            ),
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
@@ -102,43 +115,68 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Google OAuth Configuration
-GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
-GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
+GOOGLE_CLIENT_ID = env.get('GOOGLE_CLIENT_ID')
+GOOGLE_CLIENT_SECRET = env.get('GOOGLE_CLIENT_SECRET')
 
 # Allow popups for Google Sign-In. This is necessary to prevent the
 # "postMessage" error with the Google Sign-In popup.
 SECURE_CROSS_ORIGIN_OPENER_POLICY = 'same-origin-allow-popups'
 
-# Firebase Admin SDK Configuration
-try:
-    if not firebase_admin._apps:
-        # For now, we'll initialize without credentials since we don't have the service account file
-        # You'll need to get the service account key from Firebase Console
-        firebase_admin.initialize_app()
-        print("✅ Firebase Admin SDK initialized successfully (without credentials)")
-    else:
-        print("✅ Firebase Admin SDK already initialized")
-except Exception as e:
-    print(f"❌ Error initializing Firebase Admin SDK: {str(e)}")
+# Firebase Admin SDK is initialized lazily by smartprint.firebase.get_firebase_app()
+
+# Cache: per-process LocMem by default, shared Redis when REDIS_URL is set
+if env.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': env.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'smartprint',
+        }
+    }
 
 # Channel layers configuration
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer'
+# Redis lets vendor_{id} group messages cross worker processes; REDIS_HOST may list
+# several comma-separated hosts, which channels_redis shards groups across.
+# The in-memory layer only works with a single process and is kept for local runs.
+if env.get('REDIS_HOST'):
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {
+                'hosts': [(host.strip(), int(env.get('REDIS_PORT', 6379)))
+                          for host in env['REDIS_HOST'].split(',')],
+                'capacity': 1500,
+                'expiry': 10,
+            },
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'smartprint.channels_fast.FastInMemoryChannelLayer'
+        }
     }
-}
 
 # Vendor dashboard configuration
-VENDOR_DASHBOARD_URL = os.getenv('VENDOR_DASHBOARD_URL')
-VENDOR_TOKEN = os.getenv('VENDOR_TOKEN')
+VENDOR_DASHBOARD_URL = env.get('VENDOR_DASHBOARD_URL')
+VENDOR_TOKEN = env.get('VENDOR_TOKEN')
 
 # ✅ R2 credentials from .env
-R2_ACCESS_KEY = os.getenv('R2_ACCESS_KEY')
-R2_SECRET_KEY = os.getenv('R2_SECRET_KEY')
-R2_ENDPOINT = os.getenv('R2_ENDPOINT')
-R2_BUCKET = os.getenv('R2_BUCKET')
+R2_ACCESS_KEY = env.get('R2_ACCESS_KEY')
+R2_SECRET_KEY = env.get('R2_SECRET_KEY')
+R2_ENDPOINT = env.get('R2_ENDPOINT')
+R2_BUCKET = env.get('R2_BUCKET')
 
 # ✅ CORS setup
 CORS_ALLOW_ALL_ORIGINS = True  # Use CORS_ALLOWED_ORIGINS in production
 
-VENDOR_ID=1
\ No newline at end of file
+VENDOR_ID=1
+# Serve shop listings from vendor_register_details/_index.json instead of walking the bucket.
+# Run `python manage.py backfill_shop_index` once before enabling.
+R2_SHOP_INDEX_ENABLED = env.get('R2_SHOP_INDEX_ENABLED', 'False').lower() == 'true'
@@ -0,0 +1,18 @@
+"""
+Settings for WebSocket-only ASGI workers (SMARTPRINT_WS_ONLY=1).
+
+These workers only run VendorConsumer, so the admin, messages, sessions and
+staticfiles apps and the HTTP middleware chain are left out.
+"""
+from .settings import *  # noqa: F401,F403
+
+# auth/contenttypes stay because print.views imports django.contrib.auth.models
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'channels',
+    'print',
+]
+
+# HTTP is not served by these workers
+MIDDLEWARE = []
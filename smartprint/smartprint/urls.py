@@ -1,20 +1,8 @@
 from django.contrib import admin
 from django.urls import path, include
-from channels.routing import ProtocolTypeRouter, URLRouter
-from channels.auth import AuthMiddlewareStack
-from print.routing import websocket_urlpatterns
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('print.urls')),  # Include your app's routes
 ]
-
-# Add WebSocket routing
-application = ProtocolTypeRouter({
-    "websocket": AuthMiddlewareStack(
-        URLRouter(
-            websocket_urlpatterns
-        )
-    ),
-})
\ No newline at end of file
@@ -1,4 +1,3 @@
-
 #!/usr/bin/env python3
 """
 Startup script for the complete Smart Print system
@@ -7,33 +6,64 @@ Startup script for the complete Smart Print system
 import os
 import sys
 import time
-import subprocess
-import threading
+import socket
+import runpy
+import multiprocessing
+
+PROJECT_DIR = '/home/runner/workspace/smartprint'
+SERVER_HOST = '0.0.0.0'
+SERVER_PORT = 5000
 
 def run_django_server():
-    """Run Django development server"""
+    """Run Django development server in this process (no extra interpreter per command)"""
     print("🚀 Starting Django server...")
-    os.chdir('/home/runner/workspace/smartprint')
-    subprocess.run([sys.executable, 'manage.py', 'migrate'])
-    subprocess.run([sys.executable, 'manage.py', 'runserver', '0.0.0.0:5000'])
+    os.chdir(PROJECT_DIR)
+    sys.path.insert(0, PROJECT_DIR)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartprint.settings')
+    from django.core.management import execute_from_command_line
+    execute_from_command_line(['manage.py', 'migrate'])
+    # The supervisor owns the process lifetime, so skip the autoreloader's extra child
+    execute_from_command_line(['manage.py', 'runserver', f'{SERVER_HOST}:{SERVER_PORT}', '--noreload'])
+
+def wait_for_server(host='127.0.0.1', port=SERVER_PORT, timeout=60):
+    """Poll the server port until it accepts connections"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
 
 def run_vendor_client():
-    """Run vendor client after a delay"""
-    print("⏰ Waiting 10 seconds for Django server to start...")
-    time.sleep(10)
+    """Run vendor client in the foreground once the server is up"""
+    print("⏰ Waiting for Django server to accept connections...")
+    if not wait_for_server():
+        print("❌ Django server did not come up, starting vendor client anyway")
     print("🖨️  Starting vendor client...")
-    os.chdir('/home/runner/workspace/smartprint')
-    subprocess.run([sys.executable, 'vendor_client.py', '--vendor-id', 'vendor1', '--url', 'ws://0.0.0.0:5000', '--debug'])
+    os.chdir(PROJECT_DIR)
+    sys.argv = ['vendor_client.py', '--vendor-id', 'vendor1', '--url', f'ws://{SERVER_HOST}:{SERVER_PORT}', '--debug']
+    runpy.run_path(os.path.join(PROJECT_DIR, 'vendor_client.py'), run_name='__main__')
 
 def main():
     print("🎯 Starting Smart Print System...")
-    
-    # Start Django server in background thread
-    django_thread = threading.Thread(target=run_django_server, daemon=True)
-    django_thread.start()
-    
-    # Start vendor client in main thread
-    run_vendor_client()
+
+    # forkserver keeps child start-up cheap where available (not on Windows)
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    ctx = multiprocessing.get_context(start_method)
+
+    # Start Django server in a supervised background process
+    django_process = ctx.Process(target=run_django_server, name='django-server', daemon=True)
+    django_process.start()
+
+    # Start vendor client in main process
+    try:
+        run_vendor_client()
+    finally:
+        if django_process.is_alive():
+            django_process.terminate()
+        django_process.join(timeout=5)
 
 if __name__ == "__main__":
     main()
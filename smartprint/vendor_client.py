@@ -3,7 +3,7 @@
 Automated Vendor Print Client Script
 ====================================
 Continuously monitors for print jobs via WebSocket and handles automatic printing
-with linked list queue system and multiple printer support.
+with a priority job queue and a worker per printer.
 """
 
 import os
@@ -12,24 +12,33 @@ import time
 import json
 import argparse
 import requests
-import io
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import platform
 import websocket
 import threading
 import subprocess
 import tempfile
+import shutil
 import signal
-from typing import Dict, List, Optional, Tuple
+import random
+from typing import Dict, List, Mapping, Optional, Tuple
+from types import MappingProxyType
 from urllib.parse import urljoin
-from dataclasses import dataclass
-from collections import deque
+from dataclasses import dataclass, field, replace
+from collections import Counter, deque, OrderedDict
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import win32print
 import glob
 from pathlib import Path
 import logging
 from queue import Queue
+import queue
+import heapq
+import itertools
+import functools
 
 # Additional imports for Windows printing
 try:
@@ -38,6 +47,25 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# orjson is optional; the WebSocket path falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(data):
+    """Parse a JSON frame from bytes or str, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Serialize a frame to UTF-8 JSON bytes (sent as-is in a text frame)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Platform-specific printer imports
 if platform.system() == "Windows":
     try:
@@ -80,7 +108,7 @@ error_logger.addHandler(fh)
 
 @dataclass
 class PrintJobNode:
-    """Node for the linked list queue containing print job data"""
+    """Print job data held in the print queue"""
     filename: str
     download_url: str
     metadata: Dict
@@ -90,191 +118,378 @@ class PrintJobNode:
     max_attempts: int = 3
     created_time: float = None
     assigned_printer: str = None
-    next_node: 'PrintJobNode' = None
 
     def __post_init__(self):
         if self.created_time is None:
             self.created_time = time.time()
 
-class PrintJobQueue:
-    """Linked list implementation for print job queue"""
+class RollingMean:
+    """Mean of the last maxlen samples, updated in O(1) per sample"""
+    __slots__ = ('_dq', '_sum')
+
+    def __init__(self, maxlen: int):
+        self._dq = deque(maxlen=maxlen)
+        self._sum = 0.0
+
+    def add(self, x: float):
+        if len(self._dq) == self._dq.maxlen:
+            self._sum -= self._dq[0]
+        self._dq.append(x)
+        self._sum += x
+
+    def mean(self) -> float:
+        return self._sum / len(self._dq) if self._dq else 0
+
+# Print settings taken from job metadata, with their defaults
+PRINT_SETTING_DEFAULTS = (
+    ('copies', 1),
+    ('color', 'Black and White'),
+    ('orientation', 'portrait'),
+    ('page_size', 'A4'),
+    ('page_range', 'all'),
+    ('specific_pages', ''),
+    ('spiral_binding', 'No'),
+    ('lamination', 'No'),
+    ('service_type', 'unknown'),
+)
+PRINT_SETTING_NAMES = tuple(name for name, _ in PRINT_SETTING_DEFAULTS)
+
+@functools.lru_cache(maxsize=64)
+def cups_print_options(copies: int, color: str, orientation: str) -> Dict[str, str]:
+    """CUPS job options for the given settings; shared between jobs, don't mutate"""
+    options = {'ColorModel': 'RGB' if color == 'color' else 'Gray'}
+    if copies > 1:
+        options['copies'] = str(copies)
+    if orientation == 'landscape':
+        options['orientation-requested'] = '4'
+    return options
+
+# PDF backend install locations, in order of preference
+SUMATRA_PATHS = (
+    r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
+    r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
+)
+ADOBE_PATHS = (
+    r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
+    r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
+    r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
+    r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe",
+)
+
+def find_first_existing(paths) -> Optional[str]:
+    """Return the first path that exists, or None"""
+    return next((path for path in paths if os.path.exists(path)), None)
+
+# IPP job-state values, indexed by state number
+CUPS_STATE_NAMES = (None, None, None, "pending", "held", "processing",
+                    "stopped", "canceled", "aborted", "completed")
+# The only job attributes _monitor_cups_job reads
+CUPS_JOB_ATTRIBUTES = ["job-state", "job-state-reasons", "job-state-message"]
+
+STATUS_REPORT_TEMPLATE = (
+    "📊 SYSTEM STATUS REPORT:\n"
+    "   📋 Queue Size: %d jobs pending\n"
+    "   🔄 Failed Queue: %d jobs retrying\n"
+    "   🖨️  Printers: %d idle, %d busy, %d error\n"
+    "   📈 Metrics: %d completed, %d failed\n"
+    "   ⏱️  Avg Processing: %.2fs\n"
+    "   🧵 Active Workers: %d/%d"
+)
+
+# Buffer size used when overwriting files before deletion
+SHRED_CHUNK_SIZE = 1 << 20
+# Bytes per WritePrinter call when spooling RAW documents
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+_rotational_devices = {}
+
+def is_rotational_device(st_dev: int) -> Optional[bool]:
+    """Whether the block device holding st_dev is a spinning disk (cached per device).
+
+    Only Linux exposes this cheaply (sysfs); elsewhere, or when sysfs has no
+    answer, None is returned and the caller should assume it may be.
+    """
+    if st_dev in _rotational_devices:
+        return _rotational_devices[st_dev]
+    rotational = None
+    try:
+        sys_path = f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"
+        # Partitions don't carry queue/, their parent disk does
+        for candidate in (sys_path, os.path.join(sys_path, '..')):
+            flag = os.path.join(candidate, 'queue', 'rotational')
+            if os.path.exists(flag):
+                with open(flag) as f:
+                    rotational = f.read().strip() == '1'
+                break
+    except (AttributeError, OSError, ValueError):
+        pass
+    _rotational_devices[st_dev] = rotational
+    return rotational
+
+# WebSocket reconnect backoff: 0.5s doubling up to 15s, minus up to 1/4 jitter
+RECONNECT_DELAY_MIN = 0.5
+RECONNECT_DELAY_MAX = 15.0
+RECONNECT_JITTER_DIVISOR = 4
+
+# Status updates are sent as soon as this many are buffered
+STATUS_BATCH_MAX = 32
+# Most WebSocket status updates held while disconnected, and per frame when catching up
+ACK_BACKLOG_MAX = 10000
+ACK_FRAME_MAX = 500
+
+# Seconds an idle printer's ready check stays valid before its worker re-checks it
+PRINTER_READY_RECHECK = 30
+# Seconds a not-ready printer's worker waits before re-checking, doubling up to the max
+PRINTER_ERROR_BACKOFF_MIN = 5
+PRINTER_ERROR_BACKOFF_MAX = 300
+# win32 error from OpenPrinter for a printer name that is not installed
+ERROR_INVALID_PRINTER_NAME = 1801
+
+# Queue priorities: shutdown sentinels first, then retries of failed jobs, then new jobs
+PRIORITY_SHUTDOWN = -1
+PRIORITY_RETRY = 0
+PRIORITY_NEW = 1
+
+# Queued once per printer worker to make it exit
+WORKER_STOP = object()
+
+class PrintJobQueue(queue.PriorityQueue):
+    """Blocking print job queue ordered by (priority, arrival)"""
 
     def __init__(self):
-        self.head = None
-        self.tail = None
-        self.size = 0
-        self.lock = threading.RLock()
-
-    def enqueue(self, job_node: PrintJobNode):
-        """Add a job to the end of the queue"""
-        with self.lock:
-            if self.tail is None:
-                self.head = self.tail = job_node
-            else:
-                self.tail.next_node = job_node
-                self.tail = job_node
-            self.size += 1
+        super().__init__()
+        # Tie-breaker so equal-priority jobs stay FIFO and nodes are never compared
+        self._seq = itertools.count()
 
-    def dequeue(self) -> Optional[PrintJobNode]:
-        """Remove and return the first job from the queue"""
-        with self.lock:
-            if self.head is None:
-                return None
+    def enqueue(self, job_node: PrintJobNode, priority: int = PRIORITY_NEW):
+        """Add a job to the queue"""
+        self.put((priority, next(self._seq), job_node))
 
-            job_node = self.head
-            self.head = self.head.next_node
-
-            if self.head is None:
-                self.tail = None
+    def enqueue_many(self, job_nodes: List[PrintJobNode], priority: int = PRIORITY_NEW):
+        """Add several jobs to the queue under one lock acquisition"""
+        if not job_nodes:
+            return
+        with self.not_empty:
+            for job_node in job_nodes:
+                self._put((priority, next(self._seq), job_node))
+            self.unfinished_tasks += len(job_nodes)
+            self.not_empty.notify(len(job_nodes))
+
+    def dequeue(self, timeout: float = None) -> Optional[PrintJobNode]:
+        """Remove and return the next job (or WORKER_STOP), waiting up to timeout seconds"""
+        try:
+            return self.get(timeout=timeout)[2]
+        except queue.Empty:
+            return None
 
-            job_node.next_node = None
-            self.size -= 1
-            return job_node
+    def stop_consumers(self, count: int):
+        """Wake count blocked consumers with WORKER_STOP, ahead of any queued jobs"""
+        with self.not_empty:
+            for _ in range(count):
+                self._put((PRIORITY_SHUTDOWN, next(self._seq), WORKER_STOP))
+            self.unfinished_tasks += count
+            self.not_empty.notify(count)
 
     def peek(self) -> Optional[PrintJobNode]:
-        """Return the first job without removing it"""
-        with self.lock:
-            return self.head
+        """Return the job that will be served next without removing it"""
+        with self.mutex:
+            if self.queue and self.queue[0][2] is not WORKER_STOP:
+                return self.queue[0][2]
+            return None
 
     def remove_by_filename(self, filename: str) -> bool:
         """Remove a specific job by filename"""
-        with self.lock:
-            if self.head is None:
-                return False
-
-            # If head node matches
-            if self.head.filename == filename:
-                self.head = self.head.next_node
-                if self.head is None:
-                    self.tail = None
-                self.size -= 1
-                return True
-
-            # Search for the node
-            current = self.head
-            while current.next_node:
-                if current.next_node.filename == filename:
-                    current.next_node = current.next_node.next_node
-                    if current.next_node is None:
-                        self.tail = current
-                    self.size -= 1
+        with self.mutex:
+            for item in self.queue:
+                if item[2] is not WORKER_STOP and item[2].filename == filename:
+                    self.queue.remove(item)
+                    heapq.heapify(self.queue)
                     return True
-                current = current.next_node
-
             return False
 
     def get_all_jobs(self) -> List[PrintJobNode]:
-        """Get all jobs in the queue"""
-        with self.lock:
-            jobs = []
-            current = self.head
-            while current:
-                jobs.append(current)
-                current = current.next_node
-            return jobs
+        """Get all jobs in the queue in the order they will be served"""
+        with self.mutex:
+            return [item[2] for item in sorted(self.queue) if item[2] is not WORKER_STOP]
+
+    def get_retry_size(self) -> int:
+        """Get number of queued retries of failed jobs"""
+        with self.mutex:
+            return sum(1 for item in self.queue if item[0] == PRIORITY_RETRY)
 
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return self.size == 0
+        return self.empty()
 
     def get_size(self) -> int:
         """Get queue size"""
-        return self.size
+        return self.qsize()
+
+@dataclass(frozen=True)
+class PrinterState:
+    """State of one managed printer; replaced, never mutated, on every change"""
+    name: str
+    status: str = 'idle'  # idle, busy, error
+    current_job: Optional[PrintJobNode] = None
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    added_time: float = field(default_factory=time.time)
 
 class PrinterManager:
     """Manages multiple printers and job distribution"""
 
     def __init__(self, primary_printer: str = None, max_printers: int = 10):
         self.max_printers = max_printers
-        self.printers = {}  # printer_name -> printer_info
-        self.printer_status = {}  # printer_name -> status (idle, busy, error)
-        self.printer_jobs = {}  # printer_name -> current_job
-        self.lock = threading.RLock()
+        # Immutable printer_name -> PrinterState snapshot, swapped wholesale on every
+        # change so readers never take a lock
+        self._state = MappingProxyType({})
+        self._write_lock = threading.Lock()
+        # (snapshot, stats) for the last get_printer_stats call
+        self._stats_cache = (None, None)
         self.primary_printer = primary_printer or "HP Deskjet 1510 series (copy 3)"
+        self.worker_target = None  # callable(printer_name) run by each printer's worker
+        self.workers = {}  # printer_name -> worker thread
 
         # Initialize with primary printer
         self.add_printer(self.primary_printer)
         print(f"🖨️ Primary printer set: {self.primary_printer}")
 
+    @property
+    def printers(self) -> Mapping[str, 'PrinterState']:
+        return self._state
+
+    def _publish(self, printer: 'PrinterState'):
+        """Swap in a snapshot with one printer's state replaced; caller must hold _write_lock"""
+        self._state = MappingProxyType({**self._state, printer.name: printer})
+
     def add_printer(self, printer_name: str):
         """Add a printer to the manager"""
-        with self.lock:
-            if len(self.printers) >= self.max_printers:
+        with self._write_lock:
+            if len(self._state) >= self.max_printers:
                 return False
 
-            self.printers[printer_name] = {
-                'name': printer_name,
-                'added_time': time.time(),
-                'jobs_completed': 0,
-                'jobs_failed': 0
-            }
-            self.printer_status[printer_name] = 'idle'
-            self.printer_jobs[printer_name] = None
+            self._publish(PrinterState(name=printer_name))
+            if self.worker_target:
+                self._start_worker(printer_name)
             return True
 
+    def start_workers(self, target):
+        """Start one worker thread per known printer, and for printers added later"""
+        with self._write_lock:
+            self.worker_target = target
+            for printer_name in self._state:
+                self._start_worker(printer_name)
+
+    def _start_worker(self, printer_name: str):
+        """Start the worker thread for a printer unless it is already running"""
+        worker = self.workers.get(printer_name)
+        if worker and worker.is_alive():
+            return
+        worker = threading.Thread(target=self.worker_target, args=(printer_name,),
+                                  name=f"printer-worker-{printer_name}", daemon=True)
+        self.workers[printer_name] = worker
+        worker.start()
+
+    def remove_printer(self, printer_name: str):
+        """Forget a printer that is no longer installed; its worker exits on its own"""
+        with self._write_lock:
+            self._state = MappingProxyType({name: p for name, p in self._state.items() if name != printer_name})
+            self.workers.pop(printer_name, None)
+
+    def printer_readiness(self, printer_name: str) -> str:
+        """Return 'ready', 'not_ready' or 'missing' for a printer"""
+        if PLATFORM_PRINTING != "windows":
+            return 'ready'
+        try:
+            handle = win32print.OpenPrinter(printer_name)
+        except Exception as e:
+            if getattr(e, 'winerror', None) == ERROR_INVALID_PRINTER_NAME:
+                return 'missing'
+            return 'not_ready'
+        try:
+            info = win32print.GetPrinter(handle, 2)
+            return 'ready' if info['Status'] == 0 else 'not_ready'
+        except Exception:
+            return 'not_ready'
+        finally:
+            win32print.ClosePrinter(handle)
+
+    def has_healthy_printer(self, exclude: str = None) -> bool:
+        """Check whether any printer other than `exclude` is not in error"""
+        return any(p.status != 'error' for name, p in self._state.items() if name != exclude)
+
     def get_available_printer(self) -> Optional[str]:
         # Always dynamically find a working printer
         fallback = find_working_printer()
         if fallback:
-            if fallback not in self.printers:
+            if fallback not in self._state:
                 self.add_printer(fallback)
             return fallback
         return None
 
+    def _set_status(self, printer_name: str, status: str, job: Optional[PrintJobNode] = None):
+        """Set a known printer's status and current job"""
+        with self._write_lock:
+            printer = self._state.get(printer_name)
+            if printer:
+                self._publish(replace(printer, status=status, current_job=job))
+
     def set_printer_busy(self, printer_name: str, job: PrintJobNode):
         """Mark printer as busy with a job"""
-        with self.lock:
-            if printer_name in self.printer_status:
-                self.printer_status[printer_name] = 'busy'
-                self.printer_jobs[printer_name] = job
+        self._set_status(printer_name, 'busy', job)
 
     def set_printer_idle(self, printer_name: str):
         """Mark printer as idle"""
-        with self.lock:
-            if printer_name in self.printer_status:
-                self.printer_status[printer_name] = 'idle'
-                self.printer_jobs[printer_name] = None
+        self._set_status(printer_name, 'idle')
 
     def set_printer_error(self, printer_name: str):
         """Mark printer as having an error"""
-        with self.lock:
-            if printer_name in self.printer_status:
-                self.printer_status[printer_name] = 'error'
-                self.printer_jobs[printer_name] = None
+        self._set_status(printer_name, 'error')
 
     def get_printer_stats(self) -> Dict:
-        """Get statistics for all printers"""
-        with self.lock:
-            stats = {
-                'total_printers': len(self.printers),
-                'idle_printers': len([s for s in self.printer_status.values() if s == 'idle']),
-                'busy_printers': len([s for s in self.printer_status.values() if s == 'busy']),
-                'error_printers': len([s for s in self.printer_status.values() if s == 'error']),
-                'printers': []
-            }
+        """Get statistics for all printers from the current snapshot (lock-free).
 
-            for name, info in self.printers.items():
-                stats['printers'].append({
-                    'name': name,
-                    'status': self.printer_status.get(name, 'unknown'),
-                    'current_job': self.printer_jobs.get(name),
-                    'jobs_completed': info.get('jobs_completed', 0),
-                    'jobs_failed': info.get('jobs_failed', 0)
-                })
+        Every state change publishes a new snapshot, so the stats are only
+        rebuilt when something actually changed. Callers must not mutate them.
+        """
+        state = self._state
+        cached_state, cached_stats = self._stats_cache
+        if cached_state is state:
+            return cached_stats
+
+        printers = state.values()
+        counts = Counter(p.status for p in printers)
+        stats = {
+            'total_printers': len(printers),
+            'idle_printers': counts['idle'],
+            'busy_printers': counts['busy'],
+            'error_printers': counts['error'],
+            'printers': [{
+                'name': p.name,
+                'status': p.status,
+                'current_job': p.current_job,
+                'jobs_completed': p.jobs_completed,
+                'jobs_failed': p.jobs_failed
+            } for p in printers]
+        }
+        self._stats_cache = (state, stats)
+        return stats
 
-            return stats
+    def _increment(self, printer_name: str, counter: str):
+        """Increment one of a printer's job counters"""
+        with self._write_lock:
+            printer = self._state.get(printer_name)
+            if printer:
+                self._publish(replace(printer, **{counter: getattr(printer, counter) + 1}))
 
     def increment_job_completed(self, printer_name: str):
         """Increment completed job count for printer"""
-        with self.lock:
-            if printer_name in self.printers:
-                self.printers[printer_name]['jobs_completed'] += 1
+        self._increment(printer_name, 'jobs_completed')
 
     def increment_job_failed(self, printer_name: str):
         """Increment failed job count for printer"""
-        with self.lock:
-            if printer_name in self.printers:
-                self.printers[printer_name]['jobs_failed'] += 1
+        self._increment(printer_name, 'jobs_failed')
 
 def find_working_printer():
     """Find a working printer, prioritizing HP printers."""
@@ -448,6 +663,12 @@ def create_passport_photo_layout(input_image_path, output_path, total_prints=8):
         print(f"❌ Error creating passport photo layout: {e}")
         return False
 
+def write_all(fd: int, data: bytes):
+    """Write all of data to a raw file descriptor, handling short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 def print_image_automatically(image_path, printer_name, job_filename=None):
     """
     Print an image automatically using multiple methods, with queue monitoring if job_filename is provided.
@@ -558,6 +779,30 @@ def is_job_in_queue(printer_name, job_filename):
         print(f"Error checking print queue: {e}")
         return False
 
+def spooled_job_ids(printer_name) -> set:
+    """Ids of the jobs currently in a printer's spool queue (empty on error)"""
+    try:
+        handle = win32print.OpenPrinter(printer_name)
+        try:
+            return {job['JobId'] for job in win32print.EnumJobs(handle, 0, -1, 1)}
+        finally:
+            win32print.ClosePrinter(handle)
+    except Exception:
+        return set()
+
+def wait_for_new_spool_job(printer_name, known_ids, timeout=10.0) -> Optional[int]:
+    """
+    Wait until a job that isn't in known_ids shows up in the printer's queue.
+    Returns its id, or None if nothing was spooled within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        new_ids = spooled_job_ids(printer_name) - known_ids
+        if new_ids:
+            return min(new_ids)
+        time.sleep(0.2)
+    return None
+
 def wait_for_job_in_and_out_of_queue(printer_name, job_filename, print_func, max_retries=5):
     """
     Repeatedly send the print job until it appears in the queue.
@@ -588,7 +833,8 @@ def wait_for_job_in_and_out_of_queue(printer_name, job_filename, print_func, max
     return False
 
 class AutomatedVendorPrintClient:
-    def __init__(self, vendor_id: str, base_url: str = "ws://localhost:8000", debug: bool = False, primary_printer: str = None):
+    def __init__(self, vendor_id: str, base_url: str = "ws://localhost:8000", debug: bool = False, primary_printer: str = None,
+                 raw_pdf: bool = False):
         """
         Initialize the automated vendor print client with enhanced queue system.
 
@@ -597,8 +843,14 @@ class AutomatedVendorPrintClient:
             base_url: Base WebSocket URL of the Django application
             debug: Enable debug logging
             primary_printer: Primary printer name to use
+            raw_pdf: Spool PDFs straight to the printer (needs a PDF-capable driver)
         """
         self.vendor_id = vendor_id
+        # The job request frame never changes, so encode it once
+        self._job_request_frame = json_dumps({
+            'type': 'request_print_jobs',
+            'vendor_id': vendor_id
+        })
 
         # Handle different URL formats
         if base_url.startswith('http://'):
@@ -612,34 +864,103 @@ class AutomatedVendorPrintClient:
 
         # Remove trailing slash if present
         self.base_url = self.base_url.rstrip('/')
+        # HTTP endpoint for batched R2 status updates (same host as the WebSocket)
+        self._job_status_url = (self.base_url.replace('ws://', 'http://').replace('wss://', 'https://')
+                                + '/update-job-status-batch/')
 
         self.debug = debug
+        self._ts_cache = (0, '')  # (epoch second, formatted timestamp) for log()
+        self.raw_pdf = raw_pdf
         self.ws = None
-        self.is_running = True
+        # Set once on shutdown; background loops wait on it instead of sleeping
+        self._stop = threading.Event()
 
-        # Enhanced queue system
+        # Enhanced queue system; failed jobs are re-queued ahead of new ones
         self.print_queue = PrintJobQueue()
-        self.processed_jobs = set()  # Cache of completed job filenames
-        self.failed_jobs_queue = PrintJobQueue()  # Priority queue for failed jobs
-
-        # Printer management
+        # Bounded LRU of completed job filenames (values unused)
+        self.processed_jobs = OrderedDict()
+        self.processed_jobs_max = 50000
+        self.inflight_jobs = set()  # Filenames queued or printing, so repeats aren't re-queued
+        self._processed_lock = threading.Lock()
+
+        # Worker processes for CPU-bound image layout, created on first passport job
+        self._layout_pool = None
+        self._layout_pool_lock = threading.Lock()
+
+        # The next queued job is downloaded while the current one prints;
+        # filename -> Future of download_document
+        self._download_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='prefetch')
+        self._prefetched = {}
+        self._prefetch_lock = threading.Lock()
+
+        # PDF backends are located once; installs don't change while the client runs
+        self._sumatra_exe = find_first_existing(SUMATRA_PATHS)
+        self._adobe_exe = find_first_existing(ADOBE_PATHS)
+        # PDF backends worth trying, in fallback order; missing installs are left out
+        self._pdf_backend_order = tuple(name for name, available in (
+            ('raw', raw_pdf and PLATFORM_PRINTING == "windows"),
+            ('sumatra', self._sumatra_exe is not None),
+            ('windows', True),
+            ('adobe', self._adobe_exe is not None),
+        ) if available)
+        # (file extension, printer) -> backend that last printed it successfully
+        self._backend_success_cache = {}
+
+        # Pooled keep-alive HTTP session for document downloads
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+
+        # System printer list (and default printer) is re-enumerated at most every
+        # _printer_cache_ttl seconds
+        self._printer_cache = None
+        self._default_printer_cache = None
+        self._printer_cache_time = 0
+        self._printer_cache_ttl = 30.0
+        # pycups connections are not thread-safe, so each worker thread keeps its own
+        self._cups_local = threading.local()
+
+        # Printer management; each printer gets a worker that consumes print_queue
         self.printer_manager = PrinterManager(primary_printer=primary_printer)
 
-        # Threading and processing
-        self.executor = ThreadPoolExecutor(max_workers=10)  # For parallel processing
-        self.processing_threads = {}  # Track active processing threads
-        self.queue_processor_running = False
+        # Outgoing job completed/failed notifications, coalesced into batch frames
+        # Kept while the WebSocket is down and sent after reconnect; oldest dropped past the cap
+        self._ack_buf = deque(maxlen=ACK_BACKLOG_MAX)
+        self._ack_timer = None
+        self._ack_lock = threading.Lock()
+        # Set when the current WebSocket connection goes away; ends its job request loop
+        self._conn_closed = threading.Event()
+        # Printer availability last reported to the server on this connection
+        self._advertised_available = None
+        # Seconds to wait before the next reconnect; doubles per failure, reset on open
+        self._reconnect_delay = RECONNECT_DELAY_MIN
+        self._r2_buf = []
+        self._r2_timer = None
+        self._r2_lock = threading.Lock()
+
+        # prepare_print_settings() results keyed by the raw metadata values
+        self._settings_cache = {}
+
+        # Incoming job frames are buffered briefly and handled as one batch
+        self._rx_buf = []
+        self._rx_timer = None
+        self._rx_lock = threading.Lock()
 
         # Performance tracking
         self.job_metrics = {
             'total_received': 0,
             'total_completed': 0,
             'total_failed': 0,
-            'average_processing_time': 0,
-            'processing_times': deque(maxlen=100)  # Keep last 100 processing times
+            'average_processing_time': 0
         }
+        self._processing_times = RollingMean(100)  # Mean over the last 100 processing times
 
         self.log("🚀 Enhanced Automated Vendor Print Client initialized")
+        self.log(f"📄 PDF backends: SumatraPDF={self._sumatra_exe or 'not found'}, Adobe={self._adobe_exe or 'not found'}")
+        if not self._sumatra_exe:
+            self.log("⚠️ SumatraPDF not found. For best results, install SumatraPDF from https://www.sumatrapdfreader.org/download-free-pdf-viewer.html")
         if self.debug:
             self.log(f"📍 Base URL: {self.base_url}")
             self.log(f"🔑 Using Vendor ID: {self.vendor_id}")
@@ -660,13 +981,39 @@ class AutomatedVendorPrintClient:
         if '127.0.0.1' in self.vendor_api_url:
             self.vendor_api_url = self.vendor_api_url.replace('127.0.0.1:8000', '0.0.0.0:8000')
 
+        self.printer_manager.start_workers(self.printer_worker)
         threading.Thread(target=self.job_directory_watcher, daemon=True).start()
         threading.Thread(target=self.vendor_api_poller, daemon=True).start()
+        # Status monitoring doesn't depend on the connection, so it runs once for the client
+        threading.Thread(target=self.status_monitor_loop, name='status-monitor', daemon=True).start()
+
+    @property
+    def is_running(self) -> bool:
+        """False once stop() has been called"""
+        return not self._stop.is_set()
+
+    def stop(self):
+        """Signal every background loop to exit and close the WebSocket"""
+        self._stop.set()
+        self._conn_closed.set()
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+    def _ts(self) -> str:
+        """Current local timestamp, formatted at most once per second."""
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached[0] != now:
+            cached = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+            self._ts_cache = cached
+        return cached[1]
 
     def log(self, message: str, level: str = "INFO"):
         """Log a message with timestamp."""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        print(f"[{self._ts()}] {level}: {message}")
 
     def debug_log(self, message: str):
         """Log debug messages only if debug mode is enabled."""
@@ -676,47 +1023,92 @@ class AutomatedVendorPrintClient:
     def on_message(self, ws, message):
         """Handle incoming WebSocket messages with enhanced processing."""
         try:
-            data = json.loads(message)
-            message_type = data.get('type')
-
-            if message_type == 'print_job':
-                job = data.get('job')
-                if job and job.get('metadata', {}).get('status') == 'no':
-                    self.handle_new_print_job(job)
-
-            elif message_type == 'print_jobs_response':
-                jobs = data.get('jobs', [])
-                if jobs:
-                    # Filter jobs with status 'no'
-                    pending_jobs = [job for job in jobs if job.get('metadata', {}).get('status') == 'no']
-                    if pending_jobs:
-                        self.handle_multiple_print_jobs(pending_jobs)
-                    else:
-                        self.debug_log("📭 No jobs with status 'no' found")
-                else:
-                    self.debug_log("📭 No print jobs available")
-
-            elif message_type == 'job_status_updated':
-                filename = data.get('filename', 'unknown')
-                status = data.get('status', 'unknown')
-                self.log(f"✅ Job status updated: {filename} -> {status}")
-
-            elif message_type == 'error':
-                self.log(f"❌ Server error: {data.get('message', 'Unknown error')}")
+            data = json_loads(message)
+            handler = self.MESSAGE_HANDLERS.get(data.get('type'))
+            if handler:
+                handler(self, data)
 
         except json.JSONDecodeError:
             self.log("❌ Invalid JSON message received")
         except Exception as e:
             self.log(f"❌ Error processing message: {str(e)}")
 
+    def _h_job_frame(self, data):
+        """Buffer print_job/print_jobs_response frames for _flush_rx"""
+        # Defer to _flush_rx so a burst of frames is queued in one pass
+        with self._rx_lock:
+            self._rx_buf.append(data)
+            if self._rx_timer is None:
+                self._rx_timer = threading.Timer(0.005, self._flush_rx)
+                self._rx_timer.daemon = True
+                self._rx_timer.start()
+
+    def _h_status(self, data):
+        """Log a job status acknowledgement from the server"""
+        filename = data.get('filename', 'unknown')
+        status = data.get('status', 'unknown')
+        self.log(f"✅ Job status updated: {filename} -> {status}")
+
+    def _h_error(self, data):
+        """Log an error reported by the server"""
+        self.log(f"❌ Server error: {data.get('message', 'Unknown error')}")
+
+    # Message type -> handler, looked up once per frame in on_message()
+    MESSAGE_HANDLERS = {
+        'print_job': _h_job_frame,
+        'print_jobs_response': _h_job_frame,
+        'job_status_updated': _h_status,
+        'error': _h_error,
+    }
+
+    def _flush_rx(self):
+        """Drain buffered job frames and hand all pending jobs over in one batch"""
+        with self._rx_lock:
+            batch, self._rx_buf = self._rx_buf, []
+            self._rx_timer = None
+
+        pending_jobs = []
+        try:
+            for data in batch:
+                if data.get('type') == 'print_job':
+                    jobs = [data['job']] if data.get('job') else []
+                else:
+                    jobs = data.get('jobs') or []
+                # Only jobs with status 'no' still need printing
+                pending_jobs.extend(job for job in jobs if job.get('metadata', {}).get('status') == 'no')
+
+            if pending_jobs:
+                self.handle_multiple_print_jobs(pending_jobs)
+            else:
+                self.debug_log("📭 No jobs with status 'no' found")
+        except Exception as e:
+            self.log(f"❌ Error processing buffered messages: {str(e)}")
+
+    def mark_processed(self, filename: str):
+        """Record a job filename as completed"""
+        with self._processed_lock:
+            self.inflight_jobs.discard(filename)
+            self.processed_jobs[filename] = None
+            self.processed_jobs.move_to_end(filename)
+            if len(self.processed_jobs) > self.processed_jobs_max:
+                self.processed_jobs.popitem(last=False)
+
+    def release_job(self, filename: str):
+        """Forget a job that failed permanently so it can be retried later"""
+        with self._processed_lock:
+            self.inflight_jobs.discard(filename)
+            self.processed_jobs.pop(filename, None)
+
     def handle_new_print_job(self, job):
         """Handle a new print job by adding it to the queue"""
         filename = job.get('filename', 'unknown')
 
-        # Check if already processed
-        if filename in self.processed_jobs:
-            self.debug_log(f"🔄 Skipping already processed job: {filename}")
-            return
+        # Check if already processed or queued
+        with self._processed_lock:
+            if filename in self.processed_jobs or filename in self.inflight_jobs:
+                self.debug_log(f"🔄 Skipping already processed job: {filename}")
+                return
+            self.inflight_jobs.add(filename)
 
         # Create job node
         job_node = PrintJobNode(
@@ -732,112 +1124,95 @@ class AutomatedVendorPrintClient:
 
         self.log(f"📋 Added print job to queue: {filename} (Queue size: {self.print_queue.get_size()})")
 
-        # Start queue processor if not running
-        if not self.queue_processor_running:
-            threading.Thread(target=self.process_print_queue, daemon=True).start()
-
     def handle_multiple_print_jobs(self, jobs):
         """Handle multiple print jobs efficiently"""
-        new_jobs = []
+        # Later duplicates of a filename within the batch win, as with sequential frames
+        incoming = {job.get('filename', 'unknown'): job for job in jobs}
 
-        for job in jobs:
-            filename = job.get('filename', 'unknown')
-
-            if filename not in self.processed_jobs:
-                job_node = PrintJobNode(
-                    filename=filename,
-                    download_url=job.get('download_url', ''),
-                    metadata=job.get('metadata', {}),
-                    service_type=job.get('service_type', 'unknown')
-                )
-                new_jobs.append(job_node)
-                self.processed_jobs.add(filename)
+        # One set difference against completed and in-flight jobs, claiming the new ones
+        with self._processed_lock:
+            new_names = incoming.keys() - self.processed_jobs.keys() - self.inflight_jobs
+            self.inflight_jobs |= new_names
+
+        new_jobs = [
+            PrintJobNode(
+                filename=filename,
+                download_url=job.get('download_url', ''),
+                metadata=job.get('metadata', {}),
+                service_type=job.get('service_type', 'unknown')
+            )
+            for filename, job in incoming.items() if filename in new_names
+        ]
 
         if new_jobs:
             # Add all jobs to queue
-            for job_node in new_jobs:
-                self.print_queue.enqueue(job_node)
-                self.job_metrics['total_received'] += 1
+            self.print_queue.enqueue_many(new_jobs)
+            self.job_metrics['total_received'] += len(new_jobs)
 
             self.log(f"📋 Added {len(new_jobs)} print jobs to queue (Queue size: {self.print_queue.get_size()})")
-
-            # Start queue processor if not running
-            if not self.queue_processor_running:
-                threading.Thread(target=self.process_print_queue, daemon=True).start()
         else:
             self.debug_log("📭 No new print jobs to process")
 
-    def process_print_queue(self):
-        """Main queue processor that handles jobs efficiently"""
-        self.queue_processor_running = True
-        self.log("🔄 Starting print queue processor")
+    def printer_worker(self, printer_name: str):
+        """Worker loop for one printer: block on the queue and print each job"""
+        self.log(f"🔄 Starting print worker for {printer_name}")
+        ready_checked_at = None
+        error_backoff = PRINTER_ERROR_BACKOFF_MIN
+        while self.is_running:
+            try:
+                # The worker only dequeues while its printer is reserved for it (idle and
+                # ready), so a job is never taken and put back for lack of a printer
+                now = time.monotonic()
+                if ready_checked_at is None or now - ready_checked_at >= PRINTER_READY_RECHECK:
+                    readiness = self.printer_manager.printer_readiness(printer_name)
+                    if readiness == 'missing':
+                        # Not installed at all, so it will never become ready
+                        self.log(f"🗑️ Printer {printer_name} is not installed, removing it")
+                        self.printer_manager.remove_printer(printer_name)
+                        if not self.printer_manager.has_healthy_printer():
+                            self.invalidate_printer_cache()
+                            self.printer_manager.get_available_printer()
+                        break
+                    if readiness != 'ready':
+                        # Leave jobs for healthy printers; only go looking for another
+                        # printer when none of the registered ones can take them
+                        self.printer_manager.set_printer_error(printer_name)
+                        if not self.printer_manager.has_healthy_printer(exclude=printer_name):
+                            self.invalidate_printer_cache()
+                            self.printer_manager.get_available_printer()
+                        self._stop.wait(error_backoff)
+                        error_backoff = min(error_backoff * 2, PRINTER_ERROR_BACKOFF_MAX)
+                        continue
+                    ready_checked_at = now
+                    error_backoff = PRINTER_ERROR_BACKOFF_MIN
+                    self.printer_manager.set_printer_idle(printer_name)
 
+                # Jobs and the shutdown sentinel wake the worker immediately; the
+                # timeout only lets an idle printer's readiness be re-checked
+                job_node = self.print_queue.dequeue(timeout=PRINTER_READY_RECHECK)
+                if job_node is WORKER_STOP:
+                    break
+                if job_node and not self.run_job(job_node, printer_name):
+                    # Confirm the printer is still healthy before taking another job
+                    ready_checked_at = None
+            except Exception as e:
+                self.log(f"❌ Error in print worker for {printer_name}: {str(e)}")
+        self.log(f"⏹️ Print worker for {printer_name} stopped")
+
+    def run_job(self, job_node: PrintJobNode, printer_name: str) -> bool:
+        """Print one job on the given printer, record the outcome and return success"""
+        job_node.assigned_printer = printer_name
+        job_node.status = "processing"
+        self.printer_manager.set_printer_busy(printer_name, job_node)
         try:
-            while self.is_running and (not self.print_queue.is_empty() or not self.failed_jobs_queue.is_empty()):
-                # Process failed jobs first (priority)
-                if not self.failed_jobs_queue.is_empty():
-                    job_node = self.failed_jobs_queue.dequeue()
-                    if job_node:
-                        self.debug_log(f"🔄 Processing priority failed job: {job_node.filename}")
-                        self.process_single_job_async(job_node, priority=True)
-
-                # Process regular jobs
-                elif not self.print_queue.is_empty():
-                    job_node = self.print_queue.dequeue()
-                    if job_node:
-                        self.process_single_job_async(job_node)
-
-                # Small delay to prevent overwhelming
-                time.sleep(0.1)
-
+            success = self.process_job_with_printer(job_node, printer_name)
         except Exception as e:
-            self.log(f"❌ Error in queue processor: {str(e)}")
+            self.log(f"❌ Error in job processing: {str(e)}")
+            success = False
         finally:
-            self.queue_processor_running = False
-            self.log("⏹️ Print queue processor stopped")
-
-    def process_single_job_async(self, job_node: PrintJobNode, priority: bool = False):
-        try:
-            # Always get a working printer dynamically
-            printer_name = self.printer_manager.get_available_printer()
-
-            if not printer_name:
-                # No available printer, re-queue the job
-                if priority:
-                    self.failed_jobs_queue.enqueue(job_node)
-                else:
-                    self.print_queue.enqueue(job_node)
-                self.debug_log(f"⏳ No available printer, re-queuing job: {job_node.filename}")
-                time.sleep(2)  # Wait before retry
-                return
-
-            # Assign printer and mark as busy
-            job_node.assigned_printer = printer_name
-            job_node.status = "processing"
-            self.printer_manager.set_printer_busy(printer_name, job_node)
-
-            # Submit job to thread pool
-            future = self.executor.submit(self.process_job_with_printer, job_node, printer_name)
-            self.processing_threads[job_node.filename] = future
-
-            # Handle completion
-            def on_job_complete(fut):
-                try:
-                    success = fut.result()
-                    self.handle_job_completion(job_node, success, priority)
-                except Exception as e:
-                    self.log(f"❌ Error in job processing thread: {str(e)}")
-                    self.handle_job_completion(job_node, False, priority)
-                finally:
-                    # Clean up
-                    self.processing_threads.pop(job_node.filename, None)
-                    self.printer_manager.set_printer_idle(printer_name)
-
-            future.add_done_callback(on_job_complete)
-
-        except Exception as e:
-            self.log(f"❌ Error processing job async: {str(e)}")
-            self.handle_job_completion(job_node, False, priority)
+            self.printer_manager.set_printer_idle(printer_name)
+        self.handle_job_completion(job_node, success)
+        return success
 
     def process_job_with_printer(self, job_node: PrintJobNode, printer_name: str) -> bool:
         """Process a print job with assigned printer including interrupt handling"""
@@ -856,30 +1231,25 @@ class AutomatedVendorPrintClient:
                 return False
             # Download document to job_dir with correct filename
             document_path = os.path.join(self.job_dir, 'vendor_jobs', job_node.filename)
-            try:
-                response = requests.get(job_node.download_url, stream=True, timeout=30)
-                response.raise_for_status()
-                with open(document_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                self.log(f"✅ Downloaded document to {document_path}")
-            except Exception as e:
-                self.log(f"❌ Failed to download document: {e}")
+            if not self.fetch_document(job_node, document_path):
                 return False
-            # Print the document
+            self.log(f"✅ Downloaded document to {document_path}")
+            # Overlap the next job's download with this job's printing
+            self.prefetch_next_job()
+            # Print straight from the downloaded file
             print_settings = self.prepare_print_settings(job_node.metadata)
-            print_success = self.print_document_with_settings(
-                open(document_path, 'rb').read(), printer_name, job_node.filename, print_settings
-            )
-            # Clean up downloaded file
             try:
-                os.remove(document_path)
-            except Exception:
-                pass
+                print_success = self.print_document_with_settings(
+                    document_path, printer_name, job_node.filename, print_settings
+                )
+            finally:
+                # Clean up downloaded file
+                self._secure_delete_file(document_path)
             if print_success:
                 processing_time = time.time() - start_time
                 self.log(f"✅ Successfully completed job: {job_node.filename} ({processing_time:.2f}s)")
+                self._processing_times.add(processing_time)
+                self.job_metrics['average_processing_time'] = self._processing_times.mean()
                 # Delete the JSON file after successful print
                 if token:
                     json_file = os.path.join(self.job_dir, 'vendor_jobs', f'{token}.json')
@@ -897,7 +1267,7 @@ class AutomatedVendorPrintClient:
             self.log(f"❌ Error processing job: {e}")
             return False
 
-    def _print_with_interrupt_handling(self, document_data: bytes, printer_name: str, 
+    def _print_with_interrupt_handling(self, document_path: str, printer_name: str, 
                                      filename: str, print_settings: Dict, job_node: PrintJobNode) -> bool:
         """Print document with enhanced interrupt handling and auto-recovery"""
         try:
@@ -912,7 +1282,7 @@ class AutomatedVendorPrintClient:
             print_settings['copies'] = remaining_copies
             # Directly call the print logic (no signal handling in threads)
             success = self.print_document_with_settings(
-                document_data, printer_name, filename, print_settings
+                document_path, printer_name, filename, print_settings
             )
             if success:
                 job_node.completed_copies = copies
@@ -1043,11 +1413,39 @@ class AutomatedVendorPrintClient:
         except Exception as e:
             self.debug_log(f"Error saving interrupt checkpoint: {e}")
 
-    def handle_job_completion(self, job_node: PrintJobNode, success: bool, was_priority: bool = False):
+    def prefetch_next_job(self):
+        """Start downloading the job at the head of the queue, if not already started"""
+        # Peek and register under one lock so fetch_document, which runs only after
+        # the job is dequeued, always sees the registration
+        with self._prefetch_lock:
+            job_node = self.print_queue.peek()
+            if job_node is None or job_node.filename in self._prefetched:
+                return
+            document_path = os.path.join(self.job_dir, 'vendor_jobs', job_node.filename)
+            try:
+                self._prefetched[job_node.filename] = self._download_pool.submit(
+                    self.download_document, job_node.download_url, document_path)
+            except RuntimeError:
+                pass  # pool shut down
+
+    def fetch_document(self, job_node: PrintJobNode, document_path: str) -> Optional[str]:
+        """Return the job's downloaded document, using a prefetch when one was started"""
+        with self._prefetch_lock:
+            future = self._prefetched.pop(job_node.filename, None)
+        if future is not None:
+            try:
+                if future.result():
+                    return document_path
+            except Exception as e:
+                self.debug_log(f"Prefetch of {job_node.filename} failed: {e}")
+        return self.download_document(job_node.download_url, document_path)
+
+    def handle_job_completion(self, job_node: PrintJobNode, success: bool):
         """Handle job completion or failure with retry logic"""
         if success:
             job_node.status = "completed"
-            self.processed_jobs.add(job_node.filename)
+            self.job_metrics['total_completed'] += 1
+            self.mark_processed(job_node.filename)
 
             # Notify backend
             self.notify_job_completed(job_node.filename)
@@ -1055,61 +1453,93 @@ class AutomatedVendorPrintClient:
 
         else:
             job_node.status = "failed"
+            job_node.attempts += 1
             self.job_metrics['total_failed'] += 1
+            # The printer may have been unplugged; re-detect before the retry
+            self.invalidate_printer_cache()
 
             # Retry logic
             if job_node.attempts < job_node.max_attempts:
                 self.log(f"🔄 Retrying failed job: {job_node.filename} (Attempt {job_node.attempts + 1}/{job_node.max_attempts})")
 
-                # Add to priority failed jobs queue for immediate retry
-                self.failed_jobs_queue.enqueue(job_node)
-
-                # If this was a priority job that failed, pause other processing briefly
-                if was_priority:
-                    time.sleep(1)
+                # Re-queue ahead of new jobs for immediate retry
+                self.print_queue.enqueue(job_node, priority=PRIORITY_RETRY)
 
             else:
                 self.log(f"❌ Job failed permanently: {job_node.filename} (Max attempts reached)")
                 self.notify_job_failed(job_node.filename, f"Failed after {job_node.max_attempts} attempts")
 
                 # Remove from processed cache to allow manual retry later
-                self.processed_jobs.discard(job_node.filename)
+                self.release_job(job_node.filename)
 
     def prepare_print_settings(self, metadata):
-        """Prepare print settings from metadata."""
-        return {
-            'copies': int(metadata.get('copies', 1)),
-            'color': metadata.get('color', 'Black and White'),
-            'orientation': metadata.get('orientation', 'portrait'),
-            'page_size': metadata.get('page_size', 'A4'),
-            'page_range': metadata.get('page_range', 'all'),
-            'specific_pages': metadata.get('specific_pages', ''),
-            'spiral_binding': metadata.get('spiral_binding', 'No'),
-            'lamination': metadata.get('lamination', 'No'),
-            'service_type': metadata.get('service_type', 'unknown')
-        }
+        """Prepare print settings from metadata, reusing settings for recurring metadata."""
+        values = tuple(metadata.get(name, default) for name, default in PRINT_SETTING_DEFAULTS)
+        try:
+            settings = self._settings_cache.get(values)
+            cacheable = True
+        except TypeError:
+            # Unhashable metadata value; build without caching
+            settings, cacheable = None, False
+
+        if settings is None:
+            settings = dict(zip(PRINT_SETTING_NAMES, values))
+            copies = settings['copies']
+            if type(copies) is not int:  # almost always an int already when it comes off JSON
+                settings['copies'] = int(copies)
+            if cacheable:
+                if len(self._settings_cache) >= 1024:
+                    self._settings_cache.clear()
+                self._settings_cache[values] = settings
+
+        # Callers may adjust the settings (e.g. remaining copies), so hand out a copy
+        return dict(settings)
 
     def get_available_printers(self) -> List[str]:
-        """Get list of available printers on the system."""
+        """Get list of available printers on the system (cached for a short TTL)."""
+        if self._printer_cache is not None and time.monotonic() - self._printer_cache_time < self._printer_cache_ttl:
+            return self._printer_cache
+
         printers = []
+        default_printer = None
 
         try:
             if PLATFORM_PRINTING == "windows":
                 # Windows printer detection
                 printers_info = win32print.EnumPrinters(2)
                 printers = [printer[2] for printer in printers_info]
+                try:
+                    default_printer = win32print.GetDefaultPrinter()
+                except Exception:
+                    pass
 
             elif PLATFORM_PRINTING == "cups":
                 # CUPS printer detection (Linux/Mac)
-                conn = cups.Connection()
-                printers_dict = conn.getPrinters()
+                printers_dict = self.get_cups_connection().getPrinters()
                 printers = list(printers_dict.keys())
 
         except Exception as e:
             self.debug_log(f"Error detecting printers: {str(e)}")
+            # Drop the connection so the next call reconnects, and don't cache the failure
+            self._cups_local.conn = None
+            return printers
 
+        self._printer_cache = printers
+        self._default_printer_cache = default_printer
+        self._printer_cache_time = time.monotonic()
         return printers
 
+    def invalidate_printer_cache(self):
+        """Force the next get_available_printers() call to re-enumerate printers."""
+        self._printer_cache = None
+
+    def get_cups_connection(self):
+        """Return this thread's CUPS connection, creating it on first use."""
+        conn = getattr(self._cups_local, 'conn', None)
+        if conn is None:
+            conn = self._cups_local.conn = cups.Connection()
+        return conn
+
     def is_printer_available(self) -> Tuple[bool, Optional[str]]:
         """Check if any printer is available."""
         printers = self.get_available_printers()
@@ -1117,15 +1547,8 @@ class AutomatedVendorPrintClient:
         if not printers:
             return False, None
 
-        # Return the first available printer
-        default_printer = printers[0]
-
-        if PLATFORM_PRINTING == "windows":
-            try:
-                # Get default printer on Windows
-                default_printer = win32print.GetDefaultPrinter()
-            except:
-                pass
+        # Prefer the system default printer (Windows), else the first available one
+        default_printer = self._default_printer_cache or printers[0]
 
         self.debug_log(f"🖨️  Available printers: {', '.join(printers)}")
         self.debug_log(f"🎯 Using printer: {default_printer}")
@@ -1137,28 +1560,31 @@ class AutomatedVendorPrintClient:
         available_printers = self.get_available_printers()
         return printer_name in available_printers
 
-    def download_document(self, file_url: str) -> Optional[bytes]:
-        """Download document content from the signed URL."""
+    def download_document(self, file_url: str, target_path: str) -> Optional[str]:
+        """Stream the document from the signed URL into target_path and return the path."""
         try:
             self.debug_log(f"⬇️  Downloading document from: {file_url[:50]}...")
 
-            # Use a separate session for document download
-            response = requests.get(file_url, timeout=30, stream=True)
+            # Documents are already compressed formats; don't pay to gzip/inflate them again
+            with self._http.get(file_url, timeout=30, stream=True,
+                                headers={'Accept-Encoding': 'identity'}) as response:
+                if response.status_code != 200:
+                    self.log(f"❌ Failed to download document: HTTP {response.status_code}")
+                    return None
 
-            if response.status_code == 200:
-                # Read content into memory
-                document_data = response.content
-                self.debug_log(f"✅ Downloaded {len(document_data)} bytes")
-                return document_data
-            else:
-                self.log(f"❌ Failed to download document: HTTP {response.status_code}")
-                return None
+                # Copy the body to disk in 64 KiB blocks instead of holding it all in memory
+                response.raw.decode_content = True
+                with open(target_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, 65536)
+
+            self.debug_log(f"✅ Downloaded {os.path.getsize(target_path)} bytes")
+            return target_path
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, OSError) as e:
             self.log(f"❌ Error downloading document: {str(e)}")
             return None
 
-    def print_document_with_settings(self, document_data: bytes, printer_name: str, 
+    def print_document_with_settings(self, document_path: str, printer_name: str, 
                                    filename: str, print_settings: Dict) -> bool:
         """Print document with specific settings using secure printing and queue monitoring."""
         try:
@@ -1167,12 +1593,24 @@ class AutomatedVendorPrintClient:
             self.log(f"🖨️  Printing {filename} ({copies} copies) to {printer_name}")
             self.log(f"📋 Settings: {print_settings}")
             if service_type == 'passport_photo':
-                return self._handle_passport_photo_printing(document_data, printer_name, filename, print_settings)
+                return self._handle_passport_photo_printing(document_path, printer_name, filename, print_settings)
+            if PLATFORM_PRINTING == "cups":
+                # Stream the downloaded file straight into cupsd; no in-memory copy or temp file
+                if not printer_name or not self.is_specific_printer_available(printer_name):
+                    printers = self.get_available_printers()
+                    if not printers:
+                        self.log("❌ No working printer found!")
+                        return False
+                    printer_name = printers[0]
+                return self._print_cups_with_settings(document_path, printer_name, filename, print_settings)
             file_extension = filename.lower().split('.')[-1]
-            temp_fd, temp_path = tempfile.mkstemp(suffix=f'.{file_extension}', prefix='secure_print_')
+            temp_path = document_path
+            if not temp_path.lower().endswith(f'.{file_extension}'):
+                # Print helpers pick their method by extension, so expose the file under the right one
+                temp_fd, temp_path = tempfile.mkstemp(suffix=f'.{file_extension}', prefix='secure_print_')
+                os.close(temp_fd)
+                shutil.copyfile(document_path, temp_path)
             try:
-                with os.fdopen(temp_fd, 'wb') as temp_file:
-                    temp_file.write(document_data)
                 if not printer_name or not self.is_specific_printer_available(printer_name):
                     self.log(f"🔍 Printer '{printer_name}' not available, auto-selecting working printer...")
                     printer_name = find_working_printer()
@@ -1195,7 +1633,7 @@ class AutomatedVendorPrintClient:
                         self._secure_print_generic(temp_path, printer_name, copies)
                     return wait_for_job_in_and_out_of_queue(printer_name, filename, print_func)
             finally:
-                if temp_path and os.path.exists(temp_path):
+                if temp_path != document_path and os.path.exists(temp_path):
                     try:
                         os.remove(temp_path)
                     except Exception:
@@ -1204,15 +1642,33 @@ class AutomatedVendorPrintClient:
             self.log(f"❌ Printing failed: {str(e)}")
             return False
 
-    def _handle_passport_photo_printing(self, document_data: bytes, printer_name: str, filename: str, print_settings: Dict) -> bool:
+    def get_layout_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool used for image layout, starting it if needed."""
+        with self._layout_pool_lock:
+            if self._layout_pool is None:
+                self._layout_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+            return self._layout_pool
+
+    def run_layout(self, input_path: str, output_path: str, total_prints: int) -> bool:
+        """Build a passport photo layout in a worker process, so PIL work runs outside the GIL."""
+        try:
+            return self.get_layout_pool().submit(
+                create_passport_photo_layout, input_path, output_path, total_prints
+            ).result(timeout=120)
+        except BrokenProcessPool as e:
+            # A crashed worker poisons the pool; drop it and do this layout in-process
+            self.log(f"⚠️ Layout worker pool failed ({e}), building layout in-process")
+            with self._layout_pool_lock:
+                self._layout_pool = None
+            return create_passport_photo_layout(input_path, output_path, total_prints=total_prints)
+
+    def _handle_passport_photo_printing(self, document_path: str, printer_name: str, filename: str, print_settings: Dict) -> bool:
         """Handle passport photo printing by creating layout and printing."""
         try:
             self.log("📸 Processing passport photo service...")
-            input_temp_fd, input_temp_path = tempfile.mkstemp(suffix='.jpg', prefix='passport_input_')
             output_temp_fd, output_temp_path = tempfile.mkstemp(suffix='.jpg', prefix='passport_layout_')
+            os.close(output_temp_fd)
             try:
-                with os.fdopen(input_temp_fd, 'wb') as input_file:
-                    input_file.write(document_data)
                 if not printer_name or not self.is_specific_printer_available(printer_name):
                     self.log(f"🔍 Printer '{printer_name}' not available, auto-selecting working printer...")
                     printer_name = find_working_printer()
@@ -1226,7 +1682,7 @@ class AutomatedVendorPrintClient:
                     self.log(f"❌ Unsupported number of passport photos: {total_prints}. Only 8, 16, or 30 allowed.")
                     return False
                 self.log(f"🔄 Creating passport photo layout for {total_prints} photos...")
-                layout_success = create_passport_photo_layout(input_temp_path, output_temp_path, total_prints=total_prints)
+                layout_success = self.run_layout(document_path, output_temp_path, total_prints)
                 if not layout_success:
                     self.log("❌ Failed to create passport photo layout")
                     return False
@@ -1239,99 +1695,95 @@ class AutomatedVendorPrintClient:
                     self.log("🎨 Printed in high quality with color settings")
                 return success
             finally:
-                for temp_path in [input_temp_path, output_temp_path]:
-                    if temp_path and os.path.exists(temp_path):
-                        try:
-                            os.remove(temp_path)
-                        except Exception:
-                            pass
+                if os.path.exists(output_temp_path):
+                    try:
+                        os.remove(output_temp_path)
+                    except Exception:
+                        pass
         except Exception as e:
             self.log(f"❌ Passport photo printing error: {str(e)}")
             return False
 
-    def _secure_print_pdf(self, file_path: str, printer_name: str, copies: int, color: bool) -> bool:
-        """SumatraPDF-focused PDF printing with enhanced reliability."""
+    def _print_raw_via_winapi(self, file_path: str, printer_name: str, copies: int) -> bool:
+        """Send the file to the spooler as one RAW document containing every copy."""
         try:
-            self.log(f"🔍 Starting SumatraPDF-focused PDF printing ({copies} copies)")
-
-            # 1. Try SumatraPDF first (most reliable for automation)
-            sumatra_paths = [
-                r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-                r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe"
-            ]
-            sumatra_exe = None
-            for path in sumatra_paths:
-                if os.path.exists(path):
-                    sumatra_exe = path
-                    self.log(f"✅ Found SumatraPDF at: {path}")
-                    break
-
-            if sumatra_exe:
-                success_count = 0
-                for i in range(copies):
-                    cmd = [sumatra_exe, "-print-to", printer_name, "-silent", file_path]
-                    result = subprocess.run(cmd, capture_output=True, timeout=30)
-                    if result.returncode == 0:
-                        success_count += 1
-                        self.log(f"✅ SumatraPDF copy {i+1} sent successfully")
-                    else:
-                        self.log(f"❌ SumatraPDF copy {i+1} failed with return code: {result.returncode}")
-                    time.sleep(1)
-
-                if success_count == copies:
-                    self.log("✅ All copies printed successfully using SumatraPDF")
-                    return True
-                elif success_count > 0:
-                    self.log(f"⚠️ Partial success: {success_count}/{copies} copies printed via SumatraPDF")
-                    return True
-            else:
-                self.log("⚠️ SumatraPDF not found. For best results, install SumatraPDF from https://www.sumatrapdfreader.org/download-free-pdf-viewer.html")
+            buf = bytearray(SPOOL_CHUNK_SIZE)
+            view = memoryview(buf)
+            handle = win32print.OpenPrinter(printer_name)
+            try:
+                # Document name carries the filename so queue monitoring can find the job
+                win32print.StartDocPrinter(handle, 1, (os.path.basename(file_path), None, "RAW"))
+                try:
+                    # Stream from disk in fixed-size chunks rather than holding the whole file
+                    with open(file_path, 'rb') as f:
+                        for _ in range(copies):
+                            f.seek(0)
+                            while True:
+                                n = f.readinto(buf)
+                                if not n:
+                                    break
+                                win32print.WritePrinter(handle, view[:n])
+                finally:
+                    win32print.EndDocPrinter(handle)
+            finally:
+                win32print.ClosePrinter(handle)
+            self.log(f"✅ Spooled {copies} raw PDF copies to {printer_name}")
+            return True
+        except Exception as e:
+            self.log(f"❌ Raw PDF spooling failed: {e}")
+            return False
 
-            # 2. Fallback: PowerShell PDF printing
-            self.log("🔄 SumatraPDF failed or not found, trying PowerShell fallback...")
-            if self._try_powershell_pdf_print(file_path, printer_name, copies, color):
-                self.log("✅ PDF printed using PowerShell fallback")
-                return True
+    def _secure_print_pdf(self, file_path: str, printer_name: str, copies: int, color: bool) -> bool:
+        """PDF printing through the first backend that works for this printer.
 
-            # 3. Fallback: Windows default PDF handler
-            self.log("🔄 PowerShell failed, trying Windows default fallback...")
-            if self._try_windows_pdf_print(file_path, printer_name, copies):
-                self.log("✅ PDF printed using Windows default fallback")
-                return True
+        Order: raw spooling (opt-in), SumatraPDF, the Windows printto handler, then
+        Adobe as a last resort. The backend that last succeeded for a printer is
+        tried first so the steady state costs a single attempt.
+        """
+        try:
+            self.log(f"🔍 Starting PDF printing ({copies} copies)")
 
-            # 4. Last resort: Adobe Acrobat (only if other methods fail)
-            self.log("🔄 All other methods failed, trying Adobe as last resort...")
-            if self._try_adobe_print(file_path, printer_name, copies):
-                self.log("✅ PDF printed using Adobe fallback")
-                return True
+            backends = {
+                'raw': self._print_raw_via_winapi,
+                'sumatra': self._try_sumatra_print,
+                'windows': self._try_windows_pdf_print,
+                'adobe': self._try_adobe_print,
+            }
+            cache_key = ('.pdf', printer_name)
+            order = list(self._pdf_backend_order)
+            preferred = self._backend_success_cache.get(cache_key)
+            if preferred in order:
+                order.remove(preferred)
+                order.insert(0, preferred)
+
+            for name in order:
+                if backends[name](file_path, printer_name, copies):
+                    self._backend_success_cache[cache_key] = name
+                    self.log(f"✅ PDF printed using {name} backend")
+                    return True
+                self.log(f"🔄 PDF backend '{name}' failed, trying next...")
+                if self._backend_success_cache.get(cache_key) == name:
+                    self._backend_success_cache.pop(cache_key, None)
 
             self.log("❌ All PDF printing methods failed")
             return False
 
         except Exception as e:
-            self.log(f"❌ SumatraPDF-focused PDF print error: {str(e)}")
+            self.log(f"❌ PDF print error: {str(e)}")
             return False
 
     def _try_sumatra_print(self, file_path: str, printer_name: str, copies: int) -> bool:
         """Try printing with SumatraPDF."""
         try:
-            sumatra_paths = [
-                r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-                r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe"
-            ]
-
-            for sumatra_path in sumatra_paths:
-                if os.path.exists(sumatra_path):
-                    for i in range(copies):
-                        cmd = [sumatra_path, "-print-to", printer_name, "-silent", file_path]
-                        result = subprocess.run(cmd, capture_output=True, timeout=30)
-                        if result.returncode != 0:
-                            break
-                        time.sleep(1)
+            if not self._sumatra_exe:
+                return False
 
-                    if result.returncode == 0:
-                        self.log("✅ PDF printed using SumatraPDF")
-                        return True
+            # One invocation for all copies: SumatraPDF takes the count as "<N>x"
+            cmd = [self._sumatra_exe, "-print-to", printer_name, "-print-settings", f"{copies}x", "-silent", file_path]
+            result = subprocess.run(cmd, capture_output=True, timeout=30 + 10 * copies)
+            if result.returncode == 0:
+                self.log(f"✅ PDF printed using SumatraPDF ({copies} copies)")
+                return True
 
             return False
 
@@ -1347,22 +1799,7 @@ class AutomatedVendorPrintClient:
         try:
             self.log(f"🖨️ Starting Adobe print job: {copies} copies to {printer_name}")
 
-            # Adobe paths in priority order
-            adobe_paths = [
-                r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
-                r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe", 
-                r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-                r"C:\Program Files (x86)\Adobe\Reader 11.0\Reader\AcroRd32.exe",
-                r"C:\Program Files\Adobe\Reader 11.0\Reader\AcroRd32.exe"
-            ]
-
-            adobe_exe = None
-            for path in adobe_paths:
-                if os.path.exists(path):
-                    adobe_exe = path
-                    self.log(f"✅ Found Adobe at: {path}")
-                    break
-
+            adobe_exe = self._adobe_exe
             if not adobe_exe:
                 self.log("❌ Adobe Reader/Acrobat not found")
                 return False
@@ -1543,79 +1980,6 @@ class AutomatedVendorPrintClient:
             self.debug_log(f"Error waiting for printer: {e}")
             return False
 
-    def _try_powershell_pdf_print(self, file_path: str, printer_name: str, copies: int, color: bool) -> bool:
-        """Try printing with PowerShell using enhanced PDF handling."""
-        try:
-            color_setting = "True" if color else "False"
-
-            ps_script = f'''
-Add-Type -AssemblyName System.Windows.Forms
-Add-Type -AssemblyName System.Drawing
-
-try {{
-    $startInfo = New-Object System.Diagnostics.ProcessStartInfo
-    $startInfo.FileName = "{file_path}"
-    $startInfo.Verb = "printto"
-    $startInfo.Arguments = '"{printer_name}"'
-    $startInfo.CreateNoWindow = $true
-    $startInfo.WindowStyle = "Hidden"
-    $startInfo.UseShellExecute = $true
-
-    $successCount = 0
-    for ($i = 0; $i -lt {copies}; $i++) {{
-        try {{
-            $process = [System.Diagnostics.Diagnostics.Process]::Start($startInfo)
-            if ($process) {{
-                $process.WaitForExit(30000)  # Wait up to 30 seconds
-                if ($process.ExitCode -eq 0) {{
-                    $successCount++
-                    Write-Host "Copy $($i+1) sent successfully"
-                }} else {{
-                    Write-Host "Copy $($i+1) failed with exit code: $($process.ExitCode)"
-                }}
-            }} else {{
-                Write-Host "Failed to start process for copy $($i+1)"
-            }}
-        }} catch {{
-            Write-Host "Error printing copy $($i+1): $_"
-        }}
-
-        if ($i -lt {copies} - 1) {{
-            Start-Sleep -Seconds 2  # Small delay between copies
-        }}
-    }}
-
-    if ($successCount -eq {copies}) {{
-        Write-Host "All copies printed successfully"
-        exit 0
-    }} elseif ($successCount -gt 0) {{
-        Write-Host "Partial success: $successCount/{copies} copies printed"
-        exit 0
-    }} else {{
-        Write-Host "No copies printed successfully"
-        exit 1
-    }}
-
-}} catch {{
-    Write-Host "PowerShell PDF print error: $_"
-    exit 1
-}}
-'''
-
-            result = subprocess.run(['powershell', '-Command', ps_script], 
-                                  capture_output=True, text=True, timeout=120)
-
-            if result.returncode == 0:
-                self.log("✅ PDF printed using PowerShell")
-                return True
-            else:
-                self.log(f"❌ PowerShell method failed: {result.stderr}")
-                return False
-
-        except Exception as e:
-            self.debug_log(f"PowerShell method failed: {e}")
-            return False
-
     def _try_windows_pdf_print(self, file_path: str, printer_name: str, copies: int) -> bool:
         """Try printing with Windows default PDF handler using enhanced methods."""
         try:
@@ -1623,6 +1987,7 @@ try {{
 
             for i in range(copies):
                 copy_success = False
+                known_jobs = spooled_job_ids(printer_name)
 
                 # Method 1: Try printto verb with printer name
                 try:
@@ -1661,7 +2026,9 @@ try {{
 
                 if copy_success:
                     success_count += 1
-                    time.sleep(2)  # Small delay between copies
+                    # Wait for the copy to reach the spooler before sending the next
+                    if wait_for_new_spool_job(printer_name, known_jobs) is None:
+                        self.debug_log(f"PDF copy {i+1} not seen in the {printer_name} queue")
                 else:
                     self.log(f"❌ All Windows methods failed for copy {i+1}")
 
@@ -1687,6 +2054,7 @@ try {{
             for i in range(copies):
                 # Try multiple methods for reliability
                 success = False
+                known_jobs = spooled_job_ids(printer_name)
 
                 # Method 1: Use printto verb
                 try:
@@ -1709,7 +2077,9 @@ try {{
                     self.log(f"❌ Failed to print image copy {i+1}")
                     return False
 
-                time.sleep(2)
+                # Let the handler spool this copy before launching the next one
+                if wait_for_new_spool_job(printer_name, known_jobs) is None:
+                    self.debug_log(f"Image copy {i+1} not seen in the {printer_name} queue")
 
             self.log("✅ Image printed successfully")
             return True
@@ -1725,6 +2095,8 @@ try {{
 
             for i in range(copies):
                 try:
+                    known_jobs = spooled_job_ids(printer_name)
+
                     # Use Windows default handler
                     result = win32api.ShellExecute(0, "printto", file_path, f'"{printer_name}"', ".", 0)
                     if result <= 32:
@@ -1733,7 +2105,9 @@ try {{
                         if result <= 32:
                             return False
 
-                    time.sleep(3)  # Wait for application to process
+                    # Wait for the application to spool the copy
+                    if wait_for_new_spool_job(printer_name, known_jobs) is None:
+                        self.debug_log(f"Document copy {i+1} not seen in the {printer_name} queue")
 
                 except Exception as e:
                     self.log(f"❌ Error printing document copy {i+1}: {e}")
@@ -1753,12 +2127,14 @@ try {{
 
             for i in range(copies):
                 try:
+                    known_jobs = spooled_job_ids(printer_name)
                     result = win32api.ShellExecute(0, "print", file_path, None, ".", 0)
                     if result <= 32:
                         self.log(f"❌ Failed to print generic file copy {i+1}")
                         return False
 
-                    time.sleep(2)
+                    if wait_for_new_spool_job(printer_name, known_jobs) is None:
+                        self.debug_log(f"Generic file copy {i+1} not seen in the {printer_name} queue")
 
                 except Exception as e:
                     self.log(f"❌ Error printing generic file copy {i+1}: {e}")
@@ -1774,21 +2150,32 @@ try {{
     def _secure_delete_file(self, file_path: str):
         """Securely delete a file with overwrite."""
         try:
-            if os.path.exists(file_path):
-                # Get file size for secure overwrite
-                file_size = os.path.getsize(file_path)
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                return
 
-                # Overwrite with random data (2 passes for speed)
+            rotational = is_rotational_device(st.st_dev)
+            if st.st_size and rotational is not False:
+                # Spinning or unknown disk: one random pass, streamed through a reusable 1 MiB buffer so
+                # memory stays flat for large PDFs
+                buf = bytearray(os.urandom(SHRED_CHUNK_SIZE))
+                view = memoryview(buf)
                 with open(file_path, 'r+b') as f:
-                    for _ in range(2):
-                        f.seek(0)
-                        f.write(os.urandom(file_size))
-                        f.flush()
-                        os.fsync(f.fileno())
-
-                # Remove file
-                os.remove(file_path)
-                self.debug_log(f"🗑️  Securely deleted: {os.path.basename(file_path)}")
+                    remaining = st.st_size
+                    while remaining > 0:
+                        n = min(remaining, SHRED_CHUNK_SIZE)
+                        f.write(view[:n])
+                        remaining -= n
+                    f.flush()
+                    os.fsync(f.fileno())
+            elif st.st_size:
+                # Known solid state: overwriting is ineffective on SSDs (wear leveling); just drop the data
+                os.truncate(file_path, 0)
+
+            # Remove file
+            os.remove(file_path)
+            self.debug_log(f"🗑️  Securely deleted: {os.path.basename(file_path)}")
 
         except Exception as e:
             self.debug_log(f"⚠️  Could not securely delete {file_path}: {e}")
@@ -1798,32 +2185,41 @@ try {{
             except:
                 pass
 
-    def _print_cups_with_settings(self, document_data: bytes, printer_name: str, 
+    def _print_cups_with_settings(self, document_path: str, printer_name: str,
                                 filename: str, print_settings: Dict) -> bool:
         """Print document on Linux/Mac using CUPS with settings and wait for completion."""
         try:
-            conn = cups.Connection()
+            conn = self.get_cups_connection()
             job_name = f"AutoPrint: {filename}"
 
-            # Prepare CUPS options based on settings
-            options = {}
-
-            if print_settings.get('copies', 1) > 1:
-                options['copies'] = str(print_settings['copies'])
-
-            if print_settings.get('color') == 'color':
-                options['ColorModel'] = 'RGB'
-            else:
-                options['ColorModel'] = 'Gray'
-
-            if print_settings.get('orientation') == 'landscape':
-                options['orientation-requested'] = '4'
+            options = cups_print_options(print_settings.get('copies', 1),
+                                         print_settings.get('color'),
+                                         print_settings.get('orientation'))
 
-            # Create temporary file-like object
-            doc_stream = io.BytesIO(document_data)
-
-            # Print the document
-            job_id = conn.printFile(printer_name, doc_stream, job_name, options)
+            # Stream the file into the job's IPP request in fixed-size chunks
+            job_id = conn.createJob(printer_name, job_name, options)
+            if job_id > 0:
+                conn.startDocument(printer_name, job_id, filename, cups.CUPS_FORMAT_AUTO, 1)
+                try:
+                    # pycups takes the data as an immutable bytes object, not a writable buffer
+                    with open(document_path, 'rb') as f:
+                        while True:
+                            chunk = f.read(SPOOL_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            if conn.writeRequestData(chunk, len(chunk)) != cups.HTTP_CONTINUE:
+                                raise RuntimeError(f"cupsd rejected document data for job {job_id}")
+                except Exception:
+                    # Don't leave a half-sent job sitting in the printer's queue
+                    try:
+                        conn.finishDocument(printer_name)
+                    finally:
+                        try:
+                            conn.cancelJob(job_id)
+                        except Exception as e:
+                            self.log(f"⚠️ Could not cancel incomplete CUPS job {job_id}: {str(e)}")
+                    raise
+                conn.finishDocument(printer_name)
 
             if job_id > 0:
                 self.log(f"✅ Print job sent successfully (Job ID: {job_id})")
@@ -1843,10 +2239,13 @@ try {{
 
         except Exception as e:
             self.log(f"❌ CUPS printing error: {str(e)}")
+            self._cups_local.conn = None  # reconnect on the next job
             return False
 
     def _monitor_cups_job(self, conn, job_id: int, filename: str, timeout: int = 300) -> bool:
         """Monitor CUPS job until completion with enhanced tracking."""
+        subscription_id = self._subscribe_cups_job(conn, job_id)
+        notify_seq = 1
         try:
             start_time = time.time()
             last_state = None
@@ -1855,18 +2254,15 @@ try {{
 
             while (time.time() - start_time) < timeout:
                 try:
-                    job_attrs = conn.getJobAttributes(job_id)
+                    job_attrs = conn.getJobAttributes(job_id, requested_attributes=CUPS_JOB_ATTRIBUTES)
                     job_state = job_attrs.get('job-state', 0)
                     job_state_reasons = job_attrs.get('job-state-reasons', [])
                     job_state_message = job_attrs.get('job-state-message', '')
 
                     # Log state changes
                     if job_state != last_state:
-                        state_names = {
-                            3: "pending", 4: "held", 5: "processing", 
-                            6: "stopped", 7: "canceled", 8: "aborted", 9: "completed"
-                        }
-                        state_name = state_names.get(job_state, f"unknown({job_state})")
+                        state_name = (CUPS_STATE_NAMES[job_state] if 0 <= job_state < len(CUPS_STATE_NAMES)
+                                      else None) or f"unknown({job_state})"
                         self.log(f"🔄 CUPS job {job_id} state: {state_name}")
                         last_state = job_state
 
@@ -1890,7 +2286,12 @@ try {{
                         self.log(f"⏸️ CUPS job {job_id} is held - checking if it will resume")
                         # Continue monitoring as held jobs might resume
 
-                    time.sleep(3)  # Check every 3 seconds
+                    if subscription_id is None:
+                        time.sleep(3)  # Check every 3 seconds
+                    else:
+                        # Re-read attributes only once cupsd reports a state change
+                        notify_seq = self._wait_cups_job_event(conn, subscription_id, notify_seq,
+                                                               start_time + timeout)
 
                 except Exception as attr_error:
                     # Job might have completed and been removed
@@ -1933,60 +2334,148 @@ try {{
         except Exception as e:
             self.log(f"❌ Error monitoring CUPS job: {str(e)}")
             return False
+        finally:
+            if subscription_id is not None:
+                try:
+                    conn.cancelSubscription(subscription_id)
+                except Exception:
+                    pass
 
-    def notify_job_completed(self, filename: str):
-        """Notify the backend that a job has been completed via WebSocket."""
-        if self.ws and self.ws.sock:
-            try:
-                payload = {
-                    'type': 'job_completed',
-                    'filename': filename,
-                    'vendor_id': self.vendor_id
-                }
+    def _subscribe_cups_job(self, conn, job_id: int) -> Optional[int]:
+        """Subscribe to state changes of a CUPS job; None if the server doesn't support it"""
+        try:
+            return conn.createSubscription("/", events=["job-state-changed", "job-completed"],
+                                           job_id=job_id, lease_duration=600)
+        except Exception as e:
+            self.debug_log(f"CUPS subscriptions unavailable, polling job {job_id}: {str(e)}")
+            return None
 
-                self.debug_log(f"📤 Notifying job completion: {filename}")
-                self.ws.send(json.dumps(payload))
+    def _wait_cups_job_event(self, conn, subscription_id: int, notify_seq: int, deadline: float) -> int:
+        """Block until the subscription delivers an event or the deadline passes.
 
-            except Exception as e:
-                self.log(f"❌ Error notifying job completion: {str(e)}")
+        Returns the next notification sequence number to ask for.
+        """
+        while time.time() < deadline:
+            result = conn.getNotifications([subscription_id], [notify_seq])
+            events = result.get('events', [])
+            if events:
+                return max(e.get('notify-sequence-number', notify_seq) for e in events) + 1
+            # cupsd tells us how long to wait before asking again
+            interval = result.get('notify-get-interval', 3)
+            time.sleep(max(0.5, min(interval, deadline - time.time())))
+        return notify_seq
+
+    def notify_job_completed(self, filename: str):
+        """Notify the backend that a job has been completed via WebSocket."""
+        self.debug_log(f"📤 Notifying job completion: {filename}")
+        self._queue_ack({
+            'type': 'job_completed',
+            'filename': filename
+        })
 
     def notify_job_failed(self, filename: str, error_message: str):
         """Notify the backend that a job has failed via WebSocket."""
-        if self.ws and self.ws.sock:
-            try:
-                payload = {
-                    'type': 'job_failed',
-                    'filename': filename,
-                    'error_message': error_message,
-                    'vendor_id': self.vendor_id
-                }
-
-                self.debug_log(f"📤 Notifying job failure: {filename} - {error_message}")
-                self.ws.send(json.dumps(payload))
+        self.debug_log(f"📤 Notifying job failure: {filename} - {error_message}")
+        self._queue_ack({
+            'type': 'job_failed',
+            'filename': filename,
+            'error_message': error_message
+        })
+
+    def _queue_ack(self, update: Dict):
+        """Buffer a job status update; updates within ~10ms go out as one frame"""
+        with self._ack_lock:
+            self._ack_buf.append(update)
+            # While disconnected a full buffer just waits for on_open
+            if len(self._ack_buf) >= STATUS_BATCH_MAX and self.ws and self.ws.sock:
+                if self._ack_timer is not None:
+                    self._ack_timer.cancel()
+                    self._ack_timer = None
+                flush_now = True
+            else:
+                flush_now = False
+                if self._ack_timer is None:
+                    self._ack_timer = threading.Timer(0.01, self._flush_acks)
+                    self._ack_timer.daemon = True
+                    self._ack_timer.start()
+
+        if flush_now:
+            self._flush_acks()
+
+    def _flush_acks(self):
+        """Send all buffered job status updates as job_status_batch frames"""
+        with self._ack_lock:
+            updates, self._ack_buf = list(self._ack_buf), deque(maxlen=ACK_BACKLOG_MAX)
+            self._ack_timer = None
+
+        if not updates:
+            return
+        if not (self.ws and self.ws.sock):
+            self.debug_log(f"⚠️ WebSocket not connected, holding {len(updates)} job status updates")
+            self._requeue_acks(updates)
+            return
 
+        # A long backlog after a reconnect goes out in several frames
+        for start in range(0, len(updates), ACK_FRAME_MAX):
+            try:
+                self.ws.send(json_dumps({
+                    'type': 'job_status_batch',
+                    'vendor_id': self.vendor_id,
+                    'updates': updates[start:start + ACK_FRAME_MAX]
+                }))
             except Exception as e:
-                self.log(f"❌ Error notifying job failure: {str(e)}")
+                self.log(f"❌ Error sending job status updates: {str(e)}")
+                self._requeue_acks(updates[start:])
+                return
 
-    def update_r2_job_status(self, filename: str, status: str):
-        """Update job completion status in R2 storage via API call."""
-        try:
-            # Convert WebSocket URL to HTTP URL for API calls
-            api_base_url = self.base_url.replace('ws://', 'http://').replace('wss://', 'https://')
-            api_url = f"{api_base_url}/update-job-status/"
+    def _requeue_acks(self, updates: List[Dict]):
+        """Put unsent updates back in front of anything queued since"""
+        with self._ack_lock:
+            self._ack_buf = deque(itertools.chain(updates, self._ack_buf), maxlen=ACK_BACKLOG_MAX)
 
-            payload = {
+    def update_r2_job_status(self, filename: str, status: str):
+        """Queue a job completion status update for R2; sent in batches of up to 250ms"""
+        with self._r2_lock:
+            self._r2_buf.append({
                 'filename': filename,
                 'status': status,
-                'vendor_id': self.vendor_id,
                 'completion_time': time.time()
+            })
+            if len(self._r2_buf) >= STATUS_BATCH_MAX:
+                if self._r2_timer is not None:
+                    self._r2_timer.cancel()
+                    self._r2_timer = None
+                flush_now = True
+            else:
+                flush_now = False
+                if self._r2_timer is None:
+                    self._r2_timer = threading.Timer(0.25, self._flush_r2_status)
+                    self._r2_timer.daemon = True
+                    self._r2_timer.start()
+
+        if flush_now:
+            self._flush_r2_status()
+
+    def _flush_r2_status(self):
+        """Send all buffered R2 status updates in one API call"""
+        with self._r2_lock:
+            updates, self._r2_buf = self._r2_buf, []
+            self._r2_timer = None
+
+        if not updates:
+            return
+        try:
+            payload = {
+                'vendor_id': self.vendor_id,
+                'updates': updates
             }
 
-            response = requests.post(api_url, json=payload, timeout=30)
+            response = self._http.post(self._job_status_url, json=payload, timeout=30)
 
             if response.status_code == 200:
-                self.log(f"✅ Updated R2 storage status for {filename}: {status}")
+                self.log(f"✅ Updated R2 storage status for {len(updates)} job(s)")
             else:
-                self.log(f"⚠️  Failed to update R2 status for {filename}: HTTP {response.status_code}")
+                self.log(f"⚠️  Failed to update R2 status for {len(updates)} job(s): HTTP {response.status_code}")
 
         except Exception as e:
             self.log(f"❌ Error updating R2 job status: {str(e)}")
@@ -1998,44 +2487,60 @@ try {{
     def on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket connection close."""
         self.log("🔌 WebSocket connection closed")
-
-        # Attempt to reconnect after a delay
-        if self.is_running:
-            self.log("🔄 Attempting to reconnect in 5 seconds...")
-            time.sleep(5)
-            self.connect_websocket()
+        self._conn_closed.set()
+        # run() reconnects with backoff once run_forever returns
 
     def on_open(self, ws):
         """Handle WebSocket connection open."""
         self.log("🔌 WebSocket connection established")
+        self._reconnect_delay = RECONNECT_DELAY_MIN
 
-        # Start the job request loop
-        threading.Thread(target=self.job_request_loop, daemon=True).start()
+        # Start the job request loop; it lives exactly as long as this connection
+        self._conn_closed.set()
+        self._conn_closed = threading.Event()
+        threading.Thread(target=self.job_request_loop, args=(self._conn_closed,),
+                         name='job-request-loop', daemon=True).start()
 
-        # Start status monitoring
-        threading.Thread(target=self.status_monitor_loop, daemon=True).start()
-
-        # Send initial job request immediately
+        # Tell the server whether we can print, then catch up on jobs if we can
         try:
-            self.ws.send(json.dumps({
-                'type': 'request_print_jobs',
-                'vendor_id': self.vendor_id
-            }))
+            self._advertised_available = None
+            if self.advertise_capabilities():
+                self.ws.send(self._job_request_frame)
+            else:
+                self.log("⚠️ No printer available, not requesting jobs until one appears")
         except Exception as e:
             self.log(f"❌ Error sending initial job request: {str(e)}")
 
-    def job_request_loop(self):
-        """Continuously request print jobs every 60 seconds."""
+        # Deliver status updates that piled up while disconnected
+        self._flush_acks()
+
+    def advertise_capabilities(self) -> bool:
+        """Send a vendor_capabilities frame when printer availability changes; return availability"""
+        available, printer_name = self.is_printer_available()
+        if available != self._advertised_available:
+            self.ws.send(json_dumps({
+                'type': 'vendor_capabilities',
+                'vendor_id': self.vendor_id,
+                'printer_available': available,
+                'printer_name': printer_name
+            }))
+            self._advertised_available = available
+        return available
+
+    def job_request_loop(self, closed: threading.Event):
+        """Request print jobs every 60 seconds until the connection closes."""
         loop_count = 0
-        while self.is_running and self.ws and self.ws.sock:
+        while self.is_running and not closed.is_set():
             try:
-                # Only request if queue is not too full
-                if self.print_queue.get_size() < 5:
+                # Only request if a printer can take the jobs and the queue is not too full
+                if not self.advertise_capabilities():
+                    self.debug_log("⏳ Skipping job request - no printer available")
+                elif not self.printer_manager.printers and not self.printer_manager.get_available_printer():
+                    # Every registered printer was removed and no working one is installed yet
+                    self.debug_log("⏳ Skipping job request - no working printer registered")
+                elif self.print_queue.get_size() < 5:
                     self.debug_log("📤 Requesting new print jobs...")
-                    self.ws.send(json.dumps({
-                        'type': 'request_print_jobs',
-                        'vendor_id': self.vendor_id
-                    }))
+                    self.ws.send(self._job_request_frame)
                 else:
                     self.debug_log("⏳ Skipping job request - queue is full")
 
@@ -2044,8 +2549,8 @@ try {{
                 if loop_count % 10 == 0:  # Every 10 loops (10 minutes)
                     self.log_system_status()
 
-                # Wait 60 seconds before next request
-                time.sleep(60)
+                # Wait 60 seconds before next request, waking early on disconnect
+                closed.wait(60)
 
             except Exception as e:
                 self.log(f"❌ Error in job request loop: {str(e)}")
@@ -2060,34 +2565,34 @@ try {{
                     self.log(f"⚠️  Large queue detected: {self.print_queue.get_size()} jobs pending")
 
                 # Monitor failed jobs
-                if self.failed_jobs_queue.get_size() > 5:
-                    self.log(f"⚠️  Many failed jobs: {self.failed_jobs_queue.get_size()} jobs retrying")
+                retry_count = self.print_queue.get_retry_size()
+                if retry_count > 5:
+                    self.log(f"⚠️  Many failed jobs: {retry_count} jobs retrying")
 
                 # Monitor printer status
                 printer_stats = self.printer_manager.get_printer_stats()
                 if printer_stats['error_printers'] > 0:
                     self.log(f"⚠️  {printer_stats['error_printers']} printers have errors")
 
-                time.sleep(30)  # Check every 30 seconds
+                self._stop.wait(30)  # Check every 30 seconds
 
             except Exception as e:
                 self.debug_log(f"Error in status monitor: {str(e)}")
-                time.sleep(60)
+                self._stop.wait(60)
 
     def log_system_status(self):
         """Log comprehensive system status"""
         printer_stats = self.printer_manager.get_printer_stats()
 
-        self.log("📊 SYSTEM STATUS REPORT:")
-        self.log(f"   📋 Queue Size: {self.print_queue.get_size()} jobs pending")
-        self.log(f"   🔄 Failed Queue: {self.failed_jobs_queue.get_size()} jobs retrying")
-        self.log(f"   🖨️  Printers: {printer_stats['idle_printers']} idle, {printer_stats['busy_printers']} busy, {printer_stats['error_printers']} error")
-        self.log(f"   📈 Metrics: {self.job_metrics['total_completed']} completed, {self.job_metrics['total_failed']} failed")
-        self.log(f"   ⏱️  Avg Processing: {self.job_metrics['average_processing_time']:.2f}s")
-
-        # Log active processing threads
-        active_threads = len([t for t in self.processing_threads.values() if not t.done()])
-        self.log(f"   🧵 Active Threads: {active_threads}/{len(self.processing_threads)}")
+        # One log call so the report isn't interleaved with worker output
+        self.log(STATUS_REPORT_TEMPLATE % (
+            self.print_queue.get_size(),
+            self.print_queue.get_retry_size(),
+            printer_stats['idle_printers'], printer_stats['busy_printers'], printer_stats['error_printers'],
+            self.job_metrics['total_completed'], self.job_metrics['total_failed'],
+            self.job_metrics['average_processing_time'],
+            printer_stats['busy_printers'], len(self.printer_manager.workers),
+        ))
 
     def connect_websocket(self):
         """Connect to WebSocket server."""
@@ -2116,21 +2621,34 @@ try {{
         while self.is_running:
             try:
                 self.connect_websocket()
-                # Run WebSocket connection (this blocks until connection closes)
-                self.ws.run_forever()
+                # Run WebSocket connection (this blocks until connection closes).
+                # Frames are JSON from our own server, so skip the per-byte UTF-8 scan;
+                # pings make a half-open connection fail within ~30s.
+                self.ws.run_forever(skip_utf8_validation=True, ping_interval=20, ping_timeout=10)
 
             except KeyboardInterrupt:
                 self.log("👋 Shutting down...")
-                self.is_running = False
+                self.stop()
                 break
             except Exception as e:
                 self.log(f"💥 WebSocket error: {str(e)}")
-                if self.is_running:
-                    self.log("🔄 Retrying connection in 10 seconds...")
-                    time.sleep(10)
 
-        # Cleanup
-        self.executor.shutdown(wait=True)
+            if self.is_running:
+                # Exponential backoff, shaved by up to a quarter so a fleet of
+                # clients doesn't reconnect in lockstep after a server restart
+                delay = self._reconnect_delay
+                delay -= random.random() * (delay / RECONNECT_JITTER_DIVISOR)
+                self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_DELAY_MAX)
+                self.log(f"🔄 Reconnecting in {delay:.1f} seconds...")
+                self._stop.wait(delay)
+
+        self.print_queue.stop_consumers(len(self.printer_manager.workers))
+        self._download_pool.shutdown(wait=False, cancel_futures=True)
+        if self._layout_pool:
+            self._layout_pool.shutdown(wait=False, cancel_futures=True)
+        # Don't lose completions still waiting for the next batch
+        self._flush_r2_status()
+        self._http.close()
         self.log("🏁 Enhanced Print Client shutdown complete")
 
     def vendor_api_poller(self):
@@ -2169,7 +2687,7 @@ try {{
             except Exception as e:
                 self.log(f"❌ Error polling vendor dashboard: {e}")
 
-            time.sleep(self.job_scan_interval)  # Poll every 10 seconds
+            self._stop.wait(self.job_scan_interval)  # Poll every 10 seconds
 
     def save_job_to_local_storage(self, job):
         """Save job from vendor dashboard to local storage"""
@@ -2211,9 +2729,6 @@ try {{
             self.seen_tokens.add(token)
             self.log(f"📋 Enqueued job from vendor dashboard: {filename}")
 
-            if not self.queue_processor_running:
-                threading.Thread(target=self.process_print_queue, daemon=True).start()
-
         except Exception as e:
             self.log(f"❌ Error saving job to local storage: {e}")
 
@@ -2248,13 +2763,11 @@ try {{
                         self.print_queue.enqueue(job_node)
                         self.seen_tokens.add(token)
                         self.log(f"📋 Enqueued job from local storage: {job_file}")
-                        if not self.queue_processor_running:
-                            threading.Thread(target=self.process_print_queue, daemon=True).start()
                     except Exception as e:
                         self.log(f"❌ Error loading job file {job_file}: {e}")
             except Exception as e:
                 self.log(f"❌ Error scanning local job directory: {e}")
-            time.sleep(self.job_scan_interval)
+            self._stop.wait(self.job_scan_interval)
 
     def poll_for_print_jobs(self):
         """Poll the Django API for new print jobs from vendor-specific folder"""
@@ -2287,7 +2800,7 @@ try {{
             except Exception as e:
                 self.log(f"❌ Unexpected error in poll_for_print_jobs: {e}")
 
-            time.sleep(self.poll_interval)
+            self._stop.wait(self.poll_interval)
 
 # --- HTTP POLLING FUNCTIONS ---
 def poll_print_jobs():
@@ -2490,6 +3003,7 @@ def main():
     parser.add_argument("--adobe-local-print", action="store_true", help="Print all jobs from local storage using Adobe Reader (robust mode)")
     parser.add_argument("--adobe-monitor-print", action="store_true", help="Print all PDFs from local storage using Adobe, monitor queue, and notify website")
     parser.add_argument("--test", action="store_true", help="Test printing functionality")
+    parser.add_argument("--raw-pdf", action="store_true", help="Spool PDFs directly to printers whose driver accepts PDF")
     args = parser.parse_args()
 
     print("🔧 Parsed arguments:")
@@ -2527,7 +3041,8 @@ def main():
             vendor_id=args.vendor_id,
             base_url=args.url,
             debug=args.debug,
-            primary_printer=args.printer
+            primary_printer=args.printer,
+            raw_pdf=args.raw_pdf
         )
         client.run()
     except Exception as e:
@@ -2913,10 +3428,12 @@ def adobe_local_print_jobs():
                     file_ext = os.path.splitext(filename)[1] or '.jpg'
                     temp_fd, temp_path = tempfile.mkstemp(suffix=file_ext, prefix='print_job_')
                     temp_file = temp_path
-                    with os.fdopen(temp_fd, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                    try:
+                        # Write chunks straight to the fd, skipping the buffered file layer
+                        for chunk in response.iter_content(chunk_size=65536):
+                            write_all(temp_fd, chunk)
+                    finally:
+                        os.close(temp_fd)
                     print(f"   ✅ Downloaded to: {os.path.basename(temp_path)}")
                 except Exception as e:
                     print(f"   ❌ Download failed: {e}")